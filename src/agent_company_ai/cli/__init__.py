@@ -0,0 +1,6 @@
+"""Command-line interface for Agent Company AI.
+
+The Typer app lives in :mod:`agent_company_ai.cli.app` and is only imported
+when the ``agent-company-ai`` console script runs.  Keep this package free of
+imports so that ``import agent_company_ai.cli`` stays instant.
+"""
@@ -2,24 +2,91 @@
 
 from __future__ import annotations
 
-import asyncio
-from pathlib import Path
+import os
+import sys
+
+# Fast path: answer a bare ``--version`` before Typer and Rich are imported.
+if len(sys.argv) == 2 and sys.argv[1] in ("--version", "-V"):
+    from importlib.metadata import version as _pkg_version
+    print(f"agent-company-ai {_pkg_version('agent-company-ai')}")
+    sys.exit(0)
+
+# Fast path: a bare ``roles`` piped to another program (scripts, completion)
+# prints exactly what Rich would emit without a terminal, so skip Typer
+# and Rich (the config helpers load the Pydantic models only on demand).
+if (
+    len(sys.argv) == 2 and sys.argv[1] == "roles"
+    and not sys.stdout.isatty() and not os.environ.get("FORCE_COLOR")
+):
+    from agent_company_ai.config import list_available_roles as _list_roles
+    sys.stdout.write("Available roles:\n" + "".join(f"  {n}\n" for n in _list_roles()))
+    sys.exit(0)
+
+import copy
+import functools
+from typing import TYPE_CHECKING, NamedTuple
 
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.tree import Tree
 
-app = typer.Typer(
+if TYPE_CHECKING:
+    import asyncio
+    from pathlib import Path
+
+    from rich.table import Table
+    from rich.tree import Tree
+
+    from agent_company_ai.config import CompanyConfig
+    from agent_company_ai.core.company import Company
+    from agent_company_ai.wallet.manager import WalletManager
+
+
+class _App(typer.Typer):
+    """The root Typer app.
+
+    Typer turns every registered function into a click command on each
+    run, so ``app()`` hands it only the command named in its arguments;
+    ``--help``, unknown commands and no command at all get the whole app.
+    Hosts that build the click command themselves (``CliRunner``,
+    ``typer.main.get_command``) always get every command.
+    """
+
+    def __call__(self, *args, **kwargs):
+        argv = kwargs["args"] if "args" in kwargs else (args[0] if args else None)
+        name = _sniff_command(sys.argv[1:] if argv is None else list(argv))
+        commands = [c for c in self.registered_commands if c.name == name]
+        groups = [g for g in self.registered_groups if g.name == name]
+        if not (commands or groups):
+            return super().__call__(*args, **kwargs)
+        only = copy.copy(self)
+        only.registered_commands, only.registered_groups = commands, groups
+        return typer.Typer.__call__(only, *args, **kwargs)
+
+
+app = _App(
     name="agent-company-ai",
     help="Spin up an AI agent company - a business run by AI agents, managed by you.",
     no_args_is_help=True,
 )
-console = Console()
+# Output is marked up explicitly, so skip Rich's regex auto-highlighting.
+console = Console(highlight=False)
 
 _selected_company: str = "default"
 
+def _sniff_command(argv: list[str]) -> str | None:
+    """Return the top-level command named in *argv*, if any.
+
+    Skips global options (and the value of ``-C``/``--company``).  Returns
+    *None* when only options are given (e.g. ``--help``).
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg in ("-C", "--company"):
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
 
 def _version_callback(value: bool):
     if value:
@@ -30,6 +97,7 @@ def _version_callback(value: bool):
 
 @app.callback()
 def main(
+    ctx: typer.Context,
     company: str = typer.Option(
         "default",
         "--company",
@@ -49,23 +117,345 @@ def main(
     """Spin up an AI agent company - a business run by AI agents, managed by you."""
     global _selected_company
     _selected_company = company
+    # Commands dispatched from ``shell`` share the shell's loop and companies.
+    if not _in_shell:
+        ctx.call_on_close(_close_runner)
 
 
-def _run(coro):
-    """Run an async function synchronously."""
+@functools.lru_cache(maxsize=1)
+def _Company() -> type[Company]:
+    """Import the Company class on first use.
+
+    Pulls in the agent, LLM, and tool stack, so commands that never touch
+    a company (``roles``, ``--help``, ``dashboard``) skip it entirely.
+    """
+    from agent_company_ai.core.company import Company
+    return Company
+
+
+# Companies loaded by read-only commands, keyed by config.yaml path. Each
+# entry also records the (mtime_ns, size) of the file it was loaded from.
+_company_cache: dict[Path, tuple[tuple[int, int], Company]] = {}
+
+
+def _config_stamp(config_path: Path) -> tuple[int, int]:
+    """Return ``(mtime_ns, size)`` of *config_path*, or zeros if it is missing."""
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _cache_key(slug: str) -> Path:
+    from agent_company_ai.config import get_company_dir
+
+    return (get_company_dir(company=slug, create=False) / "config.yaml").absolute()
+
+
+async def _get_company(slug: str) -> Company:
+    """Load a company once per process and reuse it for read-only commands.
+
+    A cached instance is shut down and reloaded when its ``config.yaml``
+    has changed on disk (e.g. after ``hire`` in another process).
+    Cached companies are shut down by :func:`_close_runner` when the
+    command (or the ``shell`` session) finishes.
+    """
+    config_path = _cache_key(slug)
+    stamp = _config_stamp(config_path)
+
+    cached = _company_cache.pop(config_path, None)
+    if cached is not None:
+        if cached[0] == stamp:
+            _company_cache[config_path] = cached
+            return cached[1]
+        await cached[1].shutdown()
+
+    company = await _Company().load(company=slug)
+    _company_cache[config_path] = (stamp, company)
+    return company
+
+
+def _company_session(slug: str):
+    """``Company.session`` for one command; inside ``shell``, the cached company.
+
+    In a shell session every command works on the one instance from
+    :func:`_get_company`.  After a command succeeds the cache entry is
+    re-stamped, since the instance already holds whatever it saved to
+    ``config.yaml``; after a failure it is dropped and reloaded next time.
+    """
+    import contextlib
+
+    if not _in_shell:
+        return _Company().session(company=slug)
+
+    @contextlib.asynccontextmanager
+    async def _shared():
+        company = await _get_company(slug)
+        config_path = _cache_key(slug)
+        try:
+            yield company
+        except BaseException:
+            _company_cache.pop(config_path, None)
+            await company.shutdown()
+            raise
+        _company_cache[config_path] = (_config_stamp(config_path), company)
+
+    return _shared()
+
+
+def _existing_company_dir() -> Path:
+    """Return the selected company's directory, or exit if it has no config."""
+    from agent_company_ai.config import get_company_dir, maybe_migrate_legacy_layout
+
+    maybe_migrate_legacy_layout()
+    company_dir = get_company_dir(company=_selected_company, create=False)
+    if not (company_dir / "config.yaml").exists():
+        console.print("[red]No company found.[/red] Run 'agent-company-ai init' first.")
+        raise typer.Exit(1)
+    return company_dir
+
+
+def _load_company_config() -> tuple[Path, CompanyConfig]:
+    """Return ``(config_path, config)`` for the selected company, or exit."""
+    from agent_company_ai.config import load_config
+
+    config_path = _existing_company_dir() / "config.yaml"
+    return config_path, load_config(config_path)
+
+
+def _acquire_dir_lock(company_dir: Path) -> int | None:
+    """Block until this process holds an exclusive flock on *company_dir*.
+
+    Locks the directory itself, so no lock file is left behind.  Returns
+    the directory fd (closing it releases the lock), or ``None`` where
+    advisory file locks are unavailable.
+    """
+    try:
+        import fcntl
+    except ImportError:  # Windows: no cross-process locking
+        return None
+    fd = os.open(company_dir, os.O_RDONLY)
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                return pool.submit(asyncio.run, coro).result()
-        return loop.run_until_complete(coro)
-    except RuntimeError:
-        return asyncio.run(coro)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+def _lock_for(company_dir: Path):
+    """Serialise check-then-create steps (init, wallet creation) for a company.
+
+    Take it before loading the company, so a second CLI process (e.g.
+    ``setup`` run twice from a script) waits and then sees the result.
+    """
+    import contextlib
+
+    @contextlib.asynccontextmanager
+    async def _held():
+        fd = await _to_thread(_acquire_dir_lock, company_dir)
+        try:
+            yield
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+    return _held()
+
+
+def _fast_loop_factory():
+    """Return uvloop's (winloop's on Windows) loop factory, if installed.
+
+    Optional — requires ``pip install agent-company-ai[uvloop]``.
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop as uvloop
+        else:
+            import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def _default_executor():
+    """Thread pool behind ``_to_thread`` and ``run_in_executor(None, ...)``.
+
+    Sized by ``AGENT_COMPANY_THREADS`` (default 64) rather than asyncio's
+    CPU-based default, since the offloaded work is blocking I/O.  Threads
+    are only started as work arrives.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    try:
+        workers = max(1, int(os.environ.get("AGENT_COMPANY_THREADS", "64")))
+    except ValueError:
+        workers = 64
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agent-company")
+
+
+# The CLI's single event loop: an asyncio.Runner on 3.11+, a bare loop on 3.10.
+_runner = None
+
+# True while ``shell`` dispatches commands, which must leave the loop open.
+_in_shell = False
+
+
+def _run(coro):
+    """Run an async function synchronously on the CLI's shared event loop.
+
+    The loop (and its default executor) is created on first use and reused
+    by every later call until :func:`_close_runner` closes it.  CLI
+    commands are always invoked from synchronous code, so there is never
+    an outer loop to cooperate with; calling this from a running loop
+    raises ``RuntimeError``.
+    """
+    import asyncio
+    global _runner
+    if _runner is None:
+        loop_factory = _fast_loop_factory()
+        if hasattr(asyncio, "Runner"):
+            _runner = asyncio.Runner(loop_factory=loop_factory)
+            loop = _runner.get_loop()
+        else:
+            _runner = loop = (loop_factory or asyncio.new_event_loop)()
+            asyncio.set_event_loop(loop)
+        loop.set_default_executor(_default_executor())
+    if isinstance(_runner, asyncio.AbstractEventLoop):
+        return _runner.run_until_complete(coro)
+    return _runner.run(coro)
+
+
+def _status(message: str):
+    """A ``console.status`` spinner on a terminal, a no-op context otherwise.
+
+    When output is piped (CI logs, files) the spinner's refresh thread
+    only adds wake-ups and escape codes, so it is skipped.
+    """
+    if console.is_terminal:
+        return console.status(message)
+    import contextlib
+    return contextlib.nullcontext()
+
+
+def _build_table(
+    title: str | None, columns: tuple[tuple[str, str | None, str | None], ...]
+) -> Table:
+    """Create a Rich Table from ``(header, style, justify)`` column specs.
+
+    Specs are written as literal tuples at the call site, which Python
+    stores as constants, so no schema is rebuilt per invocation.
+    """
+    from rich.table import Table
+
+    table = Table(title=title)
+    for header, style, justify in columns:
+        table.add_column(header, style=style, justify=justify or "left")
+    return table
+
+
+# Tables longer than this go through the pager when printing to a terminal.
+_PAGER_ROWS = 200
 
 
+def _print_table(table: Table) -> None:
+    """Print *table*, paging it when it would scroll far past one screen."""
+    if table.row_count > _PAGER_ROWS and console.is_terminal:
+        with console.pager(styles=True):
+            console.print(table)
+    else:
+        console.print(table)
+
+
+async def _to_thread(func, /, *args):
+    """Run ``func(*args)`` on the loop's default executor.
+
+    Like :func:`asyncio.to_thread`, but without copying the current
+    context: the CLI sets no ContextVars, so the ``copy_context()`` and
+    ``ctx.run`` wrapper would be pure overhead.
+    """
+    import asyncio
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+async def _ainput(prompt: str = "", *, password: bool = False) -> str:
+    """Await ``console.input`` without blocking the event loop.
+
+    The read happens on a daemon thread rather than the executor: a thread
+    parked on stdin must not keep the process alive after Ctrl+C.
+    EOFError and other exceptions from the read are re-raised here.
+    """
+    import asyncio
+    import threading
+
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _settle(line: str | None, exc: BaseException | None) -> None:
+        if future.done():
+            return
+        if exc is None:
+            future.set_result(line)
+        else:
+            future.set_exception(exc)
+
+    def _read() -> None:
+        line, exc = None, None
+        try:
+            line = console.input(prompt, password=password)
+        except BaseException as e:
+            exc = e
+        try:
+            loop.call_soon_threadsafe(_settle, line, exc)
+        except RuntimeError:
+            pass  # loop already closed; nobody is waiting
+
+    threading.Thread(target=_read, name="agent-company-input", daemon=True).start()
+    return await future
+
+
+def _close_runner() -> None:
+    """Shut down cached companies, then close the shared event loop.
+
+    Registered on the root click context, so it runs however the CLI was
+    entered (console script, ``CliRunner``, ``get_command(app).main``).
+    aiosqlite connections run on non-daemon threads, which the interpreter
+    joins *before* atexit handlers run, so this can't wait for exit.
+    """
+    import asyncio
+    global _runner
+    if _runner is None:
+        return
+
+    async def _shutdown_all():
+        while _company_cache:
+            _, (_, company) = _company_cache.popitem()
+            try:
+                await company.shutdown()
+            except Exception:
+                pass
+
+    _run(_shutdown_all())
+    runner, _runner = _runner, None
+    if isinstance(runner, asyncio.AbstractEventLoop):
+        runner.run_until_complete(runner.shutdown_asyncgens())
+        runner.run_until_complete(runner.shutdown_default_executor())
+    runner.close()
+
+
+class _ProviderPreset(NamedTuple):
+    config_provider: str
+    base_url: str | None
+    model: str | None
+    env_var: str | None
+
+
+# Used for provider names outside PROVIDER_PRESETS: any OpenAI-compatible API.
+_DEFAULT_PROVIDER_PRESET = _ProviderPreset("openai", None, None, None)
+
 # Provider presets: maps user-facing name to (config provider, base_url, default_model, env_var)
-PROVIDER_PRESETS = {
+PROVIDER_PRESETS = {name: _ProviderPreset(*preset) for name, preset in {
     "anthropic":     ("anthropic", None,                                     "claude-sonnet-4-5-20250929",              "ANTHROPIC_API_KEY"),
     "openai":        ("openai",   None,                                     "gpt-4o",                                  "OPENAI_API_KEY"),
     "deepseek":      ("openai",   "https://api.deepseek.com/v1",           "deepseek-r1",                             "DEEPSEEK_API_KEY"),
@@ -77,13 +467,56 @@ PROVIDER_PRESETS = {
     "together":      ("openai",   "https://api.together.xyz/v1",           "meta-llama/Llama-3.3-70B-Instruct-Turbo", "TOGETHER_API_KEY"),
     "groq":          ("openai",   "https://api.groq.com/openai/v1",       "llama-3.3-70b-versatile",                 "GROQ_API_KEY"),
     "openai-compat": ("openai",   None,                                    None,                                      None),
+}.items()}
+
+# Interactive menu choice -> PROVIDER_PRESETS key (choice "12" means skip)
+_PROVIDER_CHOICE_MAP = {
+    "1": "anthropic", "2": "openai", "3": "deepseek",
+    "4": "mimo", "5": "kimi", "6": "qwen", "7": "minimax",
+    "8": "ollama", "9": "together", "10": "groq",
+    "11": "openai-compat",
 }
 
+_PROVIDER_MENU = "\n".join([
+    "\n[bold]Configure LLM provider[/bold]",
+    "  [cyan] [1][/cyan] Anthropic (default)",
+    "  [cyan] [2][/cyan] OpenAI",
+    "  [cyan] [3][/cyan] DeepSeek (DeepSeek-R1, etc.)",
+    "  [cyan] [4][/cyan] MiMo (DeepSeek MiMo reasoning)",
+    "  [cyan] [5][/cyan] Kimi (Moonshot AI)",
+    "  [cyan] [6][/cyan] Qwen (Alibaba Cloud)",
+    "  [cyan] [7][/cyan] MiniMax (MiniMax-M1)",
+    "  [cyan] [8][/cyan] Ollama (local, no API key needed)",
+    "  [cyan] [9][/cyan] Together AI (Llama, Mixtral, etc.)",
+    "  [cyan][10][/cyan] Groq (fast open-source inference)",
+    "  [cyan][11][/cyan] Other OpenAI-compatible endpoint",
+    "  [cyan][12][/cyan] Skip for now",
+])
+
 
 # ------------------------------------------------------------------
 # Integration setup helpers
 # ------------------------------------------------------------------
 
+_INTEGRATIONS_MENU = "\n".join([
+    "\n[bold]Configure integrations (optional)[/bold]",
+    "  [cyan][1][/cyan] Stripe (payment links & subscriptions)",
+    "  [cyan][2][/cyan] Email (send invoices & notifications)",
+    "  [cyan][3][/cyan] Gumroad (sell digital products)",
+    "  [cyan][4][/cyan] Cal.com (paid bookings)",
+    "  [cyan][5][/cyan] Invoices (generate & send invoices)",
+    "  [cyan][6][/cyan] Landing Pages (auto-enabled, no key needed)",
+    "  [cyan][7][/cyan] All of the above",
+    "  [cyan][8][/cyan] Skip for now",
+])
+
+
+@functools.lru_cache(maxsize=None)
+def _menu_text(markup: str):
+    """Parse a menu's markup into a ``rich.text.Text`` once and reuse it."""
+    from rich.text import Text
+    return Text.from_markup(markup)
+
 
 def _prompt_integrations(company_name: str) -> dict:
     """Interactively prompt for integration configuration.
@@ -96,15 +529,7 @@ def _prompt_integrations(company_name: str) -> dict:
         CalcomConfig, InvoiceConfig, LandingPageConfig,
     )
 
-    console.print("\n[bold]Configure integrations (optional)[/bold]")
-    console.print("  [cyan][1][/cyan] Stripe (payment links & subscriptions)")
-    console.print("  [cyan][2][/cyan] Email (send invoices & notifications)")
-    console.print("  [cyan][3][/cyan] Gumroad (sell digital products)")
-    console.print("  [cyan][4][/cyan] Cal.com (paid bookings)")
-    console.print("  [cyan][5][/cyan] Invoices (generate & send invoices)")
-    console.print("  [cyan][6][/cyan] Landing Pages (auto-enabled, no key needed)")
-    console.print("  [cyan][7][/cyan] All of the above")
-    console.print("  [cyan][8][/cyan] Skip for now")
+    console.print(_menu_text(_INTEGRATIONS_MENU))
 
     raw = console.input("\nChoose integrations [comma-separated, e.g. 1,2,5]: ").strip()
     if not raw or raw == "8":
@@ -125,8 +550,10 @@ def _prompt_integrations(company_name: str) -> dict:
 
     # --- Email ---
     if "2" in choices:
-        console.print("  Email provider: [cyan][1][/cyan] Resend  [cyan][2][/cyan] SendGrid")
-        ep = console.input("  Choose [1/2, default 1]: ").strip()
+        ep = console.input(
+            "  Email provider: [cyan][1][/cyan] Resend  [cyan][2][/cyan] SendGrid"
+            " — choose [1/2, default 1]: "
+        ).strip()
         email_provider = "sendgrid" if ep == "2" else "resend"
         default_env = "${SENDGRID_API_KEY}" if email_provider == "sendgrid" else "${RESEND_API_KEY}"
         email_key = console.input(
@@ -182,7 +609,7 @@ def _prompt_integrations(company_name: str) -> dict:
 # ------------------------------------------------------------------
 
 
-@app.command()
+@app.command("init")
 def init(
     name: str = typer.Option("My AI Company", "--name", "-n", help="Company name"),
     provider: str = typer.Option(None, "--provider", "-p", help="LLM provider (anthropic, openai, deepseek, mimo, kimi, qwen, minimax, ollama, together, groq, or openai-compat)"),
@@ -192,7 +619,8 @@ def init(
     skip_integrations: bool = typer.Option(False, "--skip-integrations", help="Skip integration setup prompts"),
 ):
     """Initialize a new AI agent company in the current directory."""
-    from agent_company_ai.core.company import Company
+    from rich.panel import Panel
+    Company = _Company()
     from agent_company_ai.config import save_config, LLMProviderConfig
 
     # Interactive provider selection when --provider not given
@@ -205,39 +633,21 @@ def init(
     _fully_specified = chosen_provider is not None and chosen_key is not None
 
     if chosen_provider is None:
-        console.print("\n[bold]Configure LLM provider[/bold]")
-        console.print("  [cyan] [1][/cyan] Anthropic (default)")
-        console.print("  [cyan] [2][/cyan] OpenAI")
-        console.print("  [cyan] [3][/cyan] DeepSeek (DeepSeek-R1, etc.)")
-        console.print("  [cyan] [4][/cyan] MiMo (DeepSeek MiMo reasoning)")
-        console.print("  [cyan] [5][/cyan] Kimi (Moonshot AI)")
-        console.print("  [cyan] [6][/cyan] Qwen (Alibaba Cloud)")
-        console.print("  [cyan] [7][/cyan] MiniMax (MiniMax-M1)")
-        console.print("  [cyan] [8][/cyan] Ollama (local, no API key needed)")
-        console.print("  [cyan] [9][/cyan] Together AI (Llama, Mixtral, etc.)")
-        console.print("  [cyan][10][/cyan] Groq (fast open-source inference)")
-        console.print("  [cyan][11][/cyan] Other OpenAI-compatible endpoint")
-        console.print("  [cyan][12][/cyan] Skip for now")
+        console.print(_menu_text(_PROVIDER_MENU))
         choice = console.input("\nChoose provider [1-12]: ").strip()
-        provider_map = {
-            "1": "anthropic", "2": "openai", "3": "deepseek",
-            "4": "mimo", "5": "kimi", "6": "qwen", "7": "minimax",
-            "8": "ollama", "9": "together", "10": "groq",
-            "11": "openai-compat",
-        }
         if choice in ("12", ""):
             chosen_provider = None
         else:
-            chosen_provider = provider_map.get(choice, "anthropic")
+            chosen_provider = _PROVIDER_CHOICE_MAP.get(choice, "anthropic")
 
-    if chosen_provider and chosen_provider in PROVIDER_PRESETS:
-        preset = PROVIDER_PRESETS[chosen_provider]
-        config_provider, preset_base_url, preset_model, env_var = preset
+    preset = PROVIDER_PRESETS.get(chosen_provider) if chosen_provider else None
+    if preset:
+        preset_model, env_var = preset.model, preset.env_var
 
         # Base URL: use flag > preset > prompt (for openai-compat)
         if not chosen_base_url:
-            if preset_base_url:
-                chosen_base_url = preset_base_url
+            if preset.base_url:
+                chosen_base_url = preset.base_url
             elif chosen_provider == "openai-compat" and not _fully_specified:
                 chosen_base_url = console.input("Base URL (e.g. http://localhost:8000/v1): ").strip()
 
@@ -273,27 +683,39 @@ def init(
         company = await Company.init(name=name, company=_selected_company)
         company_dir = company.company_dir
 
-        # Apply LLM config if a provider was selected
-        if chosen_provider and chosen_provider in PROVIDER_PRESETS:
-            config_provider = PROVIDER_PRESETS[chosen_provider][0]
-            provider_config = LLMProviderConfig(
-                api_key=chosen_key or "",
-                model=chosen_model or "",
-                base_url=chosen_base_url,
-            )
-            company.config.llm.default_provider = config_provider
-            if config_provider == "anthropic":
-                company.config.llm.anthropic = provider_config
-            else:
-                company.config.llm.openai = provider_config
-
-        # Apply integration overrides
-        for key, cfg in integration_overrides.items():
-            setattr(company.config.integrations, key, cfg)
-
-        save_config(company.config, company_dir / "config.yaml")
+        try:
+            # Apply LLM config if a provider was selected
+            if preset:
+                config_provider = preset.config_provider
+                provider_config = LLMProviderConfig(
+                    api_key=chosen_key or "",
+                    model=chosen_model or "",
+                    base_url=chosen_base_url,
+                )
+                company.config.llm.default_provider = config_provider
+                if config_provider == "anthropic":
+                    company.config.llm.anthropic = provider_config
+                else:
+                    company.config.llm.openai = provider_config
 
-        await company.shutdown()
+            # Apply integration overrides
+            for key, cfg in integration_overrides.items():
+                setattr(company.config.integrations, key, cfg)
+        except BaseException:
+            await company.shutdown()
+            raise
+
+        # The config write and the DB teardown are independent; overlap them,
+        # but let both finish before a failure of either is raised.
+        import asyncio
+        results = await asyncio.gather(
+            _to_thread(save_config, company.config, company_dir / "config.yaml"),
+            company.shutdown(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
         return company_dir
 
     company_dir = _run(_init())
@@ -333,7 +755,7 @@ def init(
 # ------------------------------------------------------------------
 
 
-@app.command()
+@app.command("hire")
 def hire(
     role: str = typer.Argument(help="Role to hire (e.g. ceo, developer, marketer)"),
     name: str = typer.Option(None, "--name", "-n", help="Agent name"),
@@ -341,13 +763,10 @@ def hire(
     model: str = typer.Option(None, "--model", "-m", help="Model override"),
 ):
     """Hire a new AI agent with the given role."""
-    from agent_company_ai.core.company import Company
 
     async def _hire():
-        company = await Company.load(company=_selected_company)
-        agent = await company.hire(role, agent_name=name, provider=provider, model=model)
-        await company.shutdown()
-        return agent
+        async with _company_session(_selected_company) as company:
+            return await company.hire(role, agent_name=name, provider=provider, model=model)
 
     agent = _run(_hire())
     console.print(f"[bold green]Hired {agent.name}[/bold green] as [cyan]{agent.role.title}[/cyan]")
@@ -358,17 +777,15 @@ def hire(
 # ------------------------------------------------------------------
 
 
-@app.command()
+@app.command("fire")
 def fire(
     name: str = typer.Argument(help="Name of the agent to fire"),
 ):
     """Remove an agent from the company."""
-    from agent_company_ai.core.company import Company
 
     async def _fire():
-        company = await Company.load(company=_selected_company)
-        await company.fire(name)
-        await company.shutdown()
+        async with _company_session(_selected_company) as company:
+            await company.fire(name)
 
     _run(_fire())
     console.print(f"[bold red]{name}[/bold red] has been fired.")
@@ -379,16 +796,13 @@ def fire(
 # ------------------------------------------------------------------
 
 
-@app.command()
+@app.command("team")
 def team():
     """Show all agents in the company."""
-    from agent_company_ai.core.company import Company
 
     async def _team():
-        company = await Company.load(company=_selected_company)
-        agents = company.list_agents()
-        await company.shutdown()
-        return company.config.name, agents
+        company = await _get_company(_selected_company)
+        return company.config.name, company.list_agents()
 
     company_name, agents = _run(_team())
 
@@ -396,11 +810,12 @@ def team():
         console.print("[yellow]No agents hired yet.[/yellow] Use 'agent-company-ai hire <role>' to get started.")
         return
 
-    table = Table(title=f"{company_name} - Team")
-    table.add_column("Name", style="bold")
-    table.add_column("Role", style="cyan")
-    table.add_column("Title")
-    table.add_column("Reports To", style="dim")
+    table = _build_table(f"{company_name} - Team", (
+        ("Name", "bold", None),
+        ("Role", "cyan", None),
+        ("Title", None, None),
+        ("Reports To", "dim", None),
+    ))
 
     for a in agents:
         table.add_row(a["name"], a["role"], a["title"], a["reports_to"])
@@ -413,28 +828,27 @@ def team():
 # ------------------------------------------------------------------
 
 
-@app.command()
+@app.command("assign")
 def assign(
     task: str = typer.Argument(help="Task description"),
     to: str = typer.Option(None, "--to", "-t", help="Agent name to assign to"),
 ):
     """Assign a task to an agent (or let the company decide)."""
-    from agent_company_ai.core.company import Company
+    import asyncio
+    from rich.panel import Panel
 
     async def _assign():
-        company = await Company.load(company=_selected_company)
-        t = await company.assign(task, assignee=to)
-        # Wait for task to complete if assigned
-        if to:
-            max_wait = 300  # 5 minutes
-            waited = 0
-            while not t.is_terminal and waited < max_wait:
-                await asyncio.sleep(1)
-                waited += 1
-        await company.shutdown()
+        async with _company_session(_selected_company) as company:
+            t = await company.assign(task, assignee=to)
+            # Wait for task to complete if assigned
+            if to:
+                try:
+                    await t.wait_done(timeout=300)  # 5 minutes
+                except asyncio.TimeoutError:
+                    pass
         return t
 
-    with console.status(f"Working on task..."):
+    with _status("Working on task..."):
         t = _run(_assign())
 
     if t.is_terminal:
@@ -455,16 +869,24 @@ def assign(
 # ------------------------------------------------------------------
 
 
-@app.command()
+_TASK_STATUS_COLORS = {
+    "done": "green", "failed": "red", "cancelled": "dim red",
+    "in_progress": "yellow", "pending": "dim", "assigned": "blue",
+    "review": "magenta",
+}
+# Pre-rendered "[color]status[/color]" markup for each known status.
+_TASK_STATUS_MARKUP = {
+    status: f"[{color}]{status}[/{color}]" for status, color in _TASK_STATUS_COLORS.items()
+}
+
+
+@app.command("tasks")
 def tasks():
     """Show the task board."""
-    from agent_company_ai.core.company import Company
 
     async def _tasks():
-        company = await Company.load(company=_selected_company)
-        all_tasks = company.task_board.list_all()
-        await company.shutdown()
-        return all_tasks
+        company = await _get_company(_selected_company)
+        return company.task_board.list_all()
 
     all_tasks = _run(_tasks())
 
@@ -472,28 +894,22 @@ def tasks():
         console.print("[yellow]No tasks yet.[/yellow]")
         return
 
-    table = Table(title="Task Board")
-    table.add_column("ID", style="dim")
-    table.add_column("Description")
-    table.add_column("Assignee", style="cyan")
-    table.add_column("Status")
-    table.add_column("Subtasks", justify="right")
-
-    status_colors = {
-        "done": "green", "failed": "red", "cancelled": "dim red",
-        "in_progress": "yellow", "pending": "dim", "assigned": "blue",
-        "review": "magenta",
-    }
+    table = _build_table("Task Board", (
+        ("ID", "dim", None),
+        ("Description", None, None),
+        ("Assignee", "cyan", None),
+        ("Status", None, None),
+        ("Subtasks", None, "right"),
+    ))
 
     for t in all_tasks:
-        d = t.to_dict()
-        color = status_colors.get(d["status"], "white")
+        status = t.status.value
         table.add_row(
-            d["id"],
-            d["description"][:60],
-            d["assignee"] or "-",
-            f"[{color}]{d['status']}[/{color}]",
-            f"{d['subtasks_done']}/{d['subtask_count']}" if d["subtask_count"] else "-",
+            t.id,
+            t.description[:60],
+            t.assignee or "-",
+            _TASK_STATUS_MARKUP.get(status) or f"[white]{status}[/white]",
+            f"{t.subtasks_done}/{len(t.subtasks)}" if t.subtasks else "-",
         )
 
     console.print(table)
@@ -504,38 +920,48 @@ def tasks():
 # ------------------------------------------------------------------
 
 
-@app.command()
+@app.command("chat")
 def chat(
     agent_name: str = typer.Argument(help="Name of the agent to chat with"),
 ):
     """Start an interactive chat with an agent."""
-    from agent_company_ai.core.company import Company
+    import asyncio
+    import contextlib
 
     async def _chat():
-        company = await Company.load(company=_selected_company)
-        agent = company.get_agent(agent_name)
-        if not agent:
-            console.print(f"[red]No agent named '{agent_name}'.[/red]")
-            return
-
-        console.print(f"[bold]Chatting with {agent_name} ({agent.role.title})[/bold]")
-        console.print("[dim]Type 'exit' to end the conversation.[/dim]\n")
-
-        while True:
-            try:
-                user_input = console.input("[bold blue]You>[/bold blue] ")
-            except (EOFError, KeyboardInterrupt):
-                break
-
-            if user_input.strip().lower() in ("exit", "quit", "bye"):
-                break
-
-            with console.status("Thinking..."):
-                reply = await company.chat(agent_name, user_input)
-
-            console.print(f"[bold green]{agent_name}>[/bold green] {reply}\n")
-
-        await company.shutdown()
+        async with _company_session(_selected_company) as company:
+            agent = company.get_agent(agent_name)
+            if not agent:
+                console.print(f"[red]No agent named '{agent_name}'.[/red]")
+                return
+
+            console.print(f"[bold]Chatting with {agent_name} ({agent.role.title})[/bold]")
+            console.print("[dim]Type 'exit' to end the conversation.[/dim]\n")
+
+            # Load the provider SDK while the user types the first message.
+            warming = None
+            if agent.provider is not None:
+                warming = asyncio.ensure_future(_to_thread(agent.provider.warmup))
+
+            while True:
+                try:
+                    user_input = await _ainput("[bold blue]You>[/bold blue] ")
+                except (EOFError, KeyboardInterrupt):
+                    break
+
+                if user_input.strip().lower() in ("exit", "quit", "bye"):
+                    break
+
+                if warming is not None:
+                    # A failed warmup resurfaces, with its real message, below.
+                    with contextlib.suppress(Exception):
+                        await warming
+                    warming = None
+
+                with _status("Thinking..."):
+                    reply = await company.chat(agent_name, user_input)
+
+                console.print(f"[bold green]{agent_name}>[/bold green] {reply}\n")
         console.print("[dim]Chat ended.[/dim]")
 
     _run(_chat())
@@ -546,17 +972,15 @@ def chat(
 # ------------------------------------------------------------------
 
 
-@app.command()
+@app.command("broadcast")
 def broadcast(
     message: str = typer.Argument(help="Message to send to all agents"),
 ):
     """Send a message to all agents."""
-    from agent_company_ai.core.company import Company
 
     async def _broadcast():
-        company = await Company.load(company=_selected_company)
-        await company.broadcast(message)
-        await company.shutdown()
+        async with _company_session(_selected_company) as company:
+            await company.broadcast(message)
 
     _run(_broadcast())
     console.print(f"[green]Broadcast sent to all agents.[/green]")
@@ -567,7 +991,7 @@ def broadcast(
 # ------------------------------------------------------------------
 
 
-@app.command()
+@app.command("run")
 def run(
     goal: str = typer.Argument(help="The company goal to achieve"),
     max_cycles: int = typer.Option(None, "--cycles", "-c", help="Max CEO review cycles (default: from config)"),
@@ -582,48 +1006,46 @@ def run(
     Stops when: goal achieved, max cycles reached, timeout, or task limit hit.
     Press Ctrl+C to stop gracefully.
     """
-    from agent_company_ai.core.company import Company
+    from rich.panel import Panel
 
     async def _run_goal():
-        company = await Company.load(company=_selected_company)
+        async with _company_session(_selected_company) as company:
+            # Apply CLI overrides to config
+            if max_cycles is not None:
+                company.config.autonomous.max_cycles = max_cycles
+            if max_time is not None:
+                company.config.autonomous.max_time_seconds = max_time
+            if max_tasks is not None:
+                company.config.autonomous.max_total_tasks = max_tasks
+            if budget is not None:
+                company.config.autonomous.daily_budget_usd = budget
+
+            limits = company.config.autonomous
+            budget_str = f"${limits.daily_budget_usd:.0f}/day" if limits.daily_budget_usd > 0 else "unlimited"
+            cost_str = f"${limits.max_cost_usd:.0f}/run" if limits.max_cost_usd > 0 else "unlimited"
+            console.print(Panel(
+                f"[bold]Goal:[/bold] {goal}\n\n"
+                f"The CEO will plan, delegate, and review in cycles.\n"
+                f"Limits: {limits.max_cycles} cycles, "
+                f"{limits.max_time_seconds}s timeout, "
+                f"{limits.max_total_tasks} max tasks\n"
+                f"Budget: {cost_str} per run, {budget_str} rolling\n\n"
+                f"[dim]Press Ctrl+C to stop gracefully.[/dim]",
+                title="Autonomous Mode",
+                border_style="green",
+            ))
 
-        # Apply CLI overrides to config
-        if max_cycles is not None:
-            company.config.autonomous.max_cycles = max_cycles
-        if max_time is not None:
-            company.config.autonomous.max_time_seconds = max_time
-        if max_tasks is not None:
-            company.config.autonomous.max_total_tasks = max_tasks
-        if budget is not None:
-            company.config.autonomous.daily_budget_usd = budget
-
-        limits = company.config.autonomous
-        budget_str = f"${limits.daily_budget_usd:.0f}/day" if limits.daily_budget_usd > 0 else "unlimited"
-        cost_str = f"${limits.max_cost_usd:.0f}/run" if limits.max_cost_usd > 0 else "unlimited"
-        console.print(Panel(
-            f"[bold]Goal:[/bold] {goal}\n\n"
-            f"The CEO will plan, delegate, and review in cycles.\n"
-            f"Limits: {limits.max_cycles} cycles, "
-            f"{limits.max_time_seconds}s timeout, "
-            f"{limits.max_total_tasks} max tasks\n"
-            f"Budget: {cost_str} per run, {budget_str} rolling\n\n"
-            f"[dim]Press Ctrl+C to stop gracefully.[/dim]",
-            title="Autonomous Mode",
-            border_style="green",
-        ))
+            try:
+                await company.run_goal(goal)
+            except KeyboardInterrupt:
+                company.request_stop()
+                console.print("\n[yellow]Stop requested. Finishing current wave...[/yellow]")
 
-        try:
-            await company.run_goal(goal)
-        except KeyboardInterrupt:
-            company.request_stop()
-            console.print("\n[yellow]Stop requested. Finishing current wave...[/yellow]")
-
-        summary = company._build_goal_summary()
-        scorecard = company._build_quality_scorecard()
-        await company.shutdown()
+            summary = company._build_goal_summary()
+            scorecard = company._build_quality_scorecard()
         return summary, scorecard
 
-    with console.status("[bold green]Company is running autonomously..."):
+    with _status("[bold green]Company is running autonomously..."):
         summary, scorecard = _run(_run_goal())
 
     console.print(Panel(summary, title="Goal Summary"))
@@ -647,20 +1069,17 @@ def run(
 # ------------------------------------------------------------------
 
 
-@app.command()
+@app.command("status")
 def status():
     """Show company overview and status."""
-    from agent_company_ai.core.company import Company
+    from rich.panel import Panel
+    from rich.tree import Tree
 
-    async def _status():
-        company = await Company.load(company=_selected_company)
-        s = company.status()
-        agents = company.list_agents()
-        org = company.get_org_chart()
-        await company.shutdown()
-        return s, agents, org
+    async def _company_status():
+        company = await _get_company(_selected_company)
+        return company.status(), company.list_agents(), company.get_org_chart()
 
-    s, agents, org = _run(_status())
+    s, agents, org = _run(_company_status())
 
     task_counts = s['tasks']
     if task_counts:
@@ -686,11 +1105,18 @@ def status():
 
 
 def _build_tree(tree_node: Tree, org_node: dict) -> None:
-    """Recursively build a Rich Tree from the org chart."""
-    for child in org_node.get("children", []):
-        label = f"[cyan]{child['name']}[/cyan] - {child.get('title', child.get('role', ''))}"
-        branch = tree_node.add(label)
-        _build_tree(branch, child)
+    """Build a Rich Tree from the org chart.
+
+    Walks the chart with an explicit stack, so deep org charts can't hit
+    the recursion limit.  Each node's children are added in order.
+    """
+    label = "[cyan]{}[/cyan] - {}".format
+    stack = [(tree_node, org_node)]
+    push, pop = stack.append, stack.pop
+    while stack:
+        node, org = pop()
+        for child in org.get("children", ()):
+            push((node.add(label(child["name"], child.get("title", child.get("role", "")))), child))
 
 
 # ------------------------------------------------------------------
@@ -698,46 +1124,45 @@ def _build_tree(tree_node: Tree, org_node: dict) -> None:
 # ------------------------------------------------------------------
 
 
-@app.command()
+@app.command("output")
 def output(
     task_id: str = typer.Option(None, "--task", "-t", help="Filter by task ID"),
     open_dir: bool = typer.Option(False, "--open", "-o", help="Open output directory in file manager"),
 ):
     """List deliverables produced by agents, or open the output directory."""
-    from agent_company_ai.core.company import Company
-
-    async def _output():
-        company = await Company.load(company=_selected_company)
-        artifacts = await company.get_artifacts(task_id=task_id)
-        output_dir = str(company.output_dir)
-        await company.shutdown()
-        return artifacts, output_dir
-
-    artifacts, output_dir = _run(_output())
-
     if open_dir:
+        # Only the directory is needed, so skip loading the company and its DB.
         import platform
         import subprocess
+
+        output_path = _existing_company_dir() / "output"
+        output_path.mkdir(parents=True, exist_ok=True)
+        output_dir = str(output_path)
+
         system = platform.system()
-        if system == "Darwin":
-            subprocess.Popen(["open", output_dir])
-        elif system == "Windows":
-            subprocess.Popen(["explorer", output_dir])
-        else:
-            subprocess.Popen(["xdg-open", output_dir])
+        opener = {"Darwin": "open", "Windows": "explorer"}.get(system, "xdg-open")
+        # Detach the file manager from our session and don't hand it our fds.
+        subprocess.Popen([opener, output_dir], close_fds=True, start_new_session=True)
         console.print(f"[green]Opened {output_dir}[/green]")
         return
 
+    async def _output():
+        async with _company_session(_selected_company) as company:
+            return await company.get_artifacts(task_id=task_id)
+
+    artifacts = _run(_output())
+
     if not artifacts:
         console.print("[yellow]No deliverables yet.[/yellow]")
         return
 
-    table = Table(title="Deliverables")
-    table.add_column("Task ID", style="dim")
-    table.add_column("Agent", style="cyan")
-    table.add_column("Name")
-    table.add_column("Type")
-    table.add_column("Created", style="dim")
+    table = _build_table("Deliverables", (
+        ("Task ID", "dim", None),
+        ("Agent", "cyan", None),
+        ("Name", None, None),
+        ("Type", None, None),
+        ("Created", "dim", None),
+    ))
 
     for a in artifacts:
         table.add_row(
@@ -756,57 +1181,43 @@ def output(
 # ------------------------------------------------------------------
 
 
-@app.command()
+@app.command("revenue")
 def revenue(
     days: int = typer.Option(30, "--days", "-d", help="Number of days to look back"),
 ):
     """Show company revenue summary."""
+    from rich.panel import Panel
     from agent_company_ai.storage.database import get_database
-    from agent_company_ai.config import get_company_dir, maybe_migrate_legacy_layout
 
-    maybe_migrate_legacy_layout()
-    company_dir = get_company_dir(company=_selected_company, create=False)
-    if not (company_dir / "config.yaml").exists():
-        console.print("[red]No company found.[/red] Run 'agent-company-ai init' first.")
-        raise typer.Exit(1)
+    company_dir = _existing_company_dir()
 
     async def _revenue():
         db = get_database(company_dir)
         await db.connect()
-
-        # All-time total
-        row = await db.fetch_one(
-            "SELECT COALESCE(SUM(amount_cents), 0) AS total FROM revenue "
-            "WHERE status = 'confirmed'"
-        )
-        all_time = row["total"] if row else 0
-
-        # Period total
-        row = await db.fetch_one(
-            "SELECT COALESCE(SUM(amount_cents), 0) AS total FROM revenue "
-            "WHERE status = 'confirmed' AND created_at >= datetime('now', ?)",
-            (f"-{days} days",),
-        )
-        period = row["total"] if row else 0
-
-        # Last 7 days
-        row = await db.fetch_one(
-            "SELECT COALESCE(SUM(amount_cents), 0) AS total FROM revenue "
-            "WHERE status = 'confirmed' AND created_at >= datetime('now', '-7 days')"
-        )
-        week = row["total"] if row else 0
-
-        # By source
-        sources = await db.fetch_all(
-            "SELECT source, COALESCE(SUM(amount_cents), 0) AS total, COUNT(*) AS cnt "
-            "FROM revenue WHERE status = 'confirmed' "
-            "AND created_at >= datetime('now', ?) "
-            "GROUP BY source ORDER BY total DESC",
-            (f"-{days} days",),
-        )
-
-        await db.close()
-        return all_time, period, week, sources
+        try:
+            # All-time, period and last-7-days totals in one scan
+            row = await db.fetch_one(
+                "SELECT COALESCE(SUM(amount_cents), 0) AS all_time, "
+                "COALESCE(SUM(CASE WHEN created_at >= datetime('now', ?) "
+                "THEN amount_cents ELSE 0 END), 0) AS period, "
+                "COALESCE(SUM(CASE WHEN created_at >= datetime('now', '-7 days') "
+                "THEN amount_cents ELSE 0 END), 0) AS week "
+                "FROM revenue WHERE status = 'confirmed'",
+                (f"-{days} days",),
+            )
+            all_time, period, week = (row["all_time"], row["period"], row["week"]) if row else (0, 0, 0)
+
+            # By source
+            sources = await db.fetch_all(
+                "SELECT source, COALESCE(SUM(amount_cents), 0) AS total, COUNT(*) AS cnt "
+                "FROM revenue WHERE status = 'confirmed' "
+                "AND created_at >= datetime('now', ?) "
+                "GROUP BY source ORDER BY total DESC",
+                (f"-{days} days",),
+            )
+            return all_time, period, week, sources
+        finally:
+            await db.close()
 
     all_time, period, week, sources = _run(_revenue())
 
@@ -821,10 +1232,11 @@ def revenue(
 
     # By source table
     if sources:
-        table = Table(title=f"Revenue by Source (last {days} days)")
-        table.add_column("Source", style="cyan")
-        table.add_column("Amount", justify="right", style="bold")
-        table.add_column("Transactions", justify="right")
+        table = _build_table(f"Revenue by Source (last {days} days)", (
+            ("Source", "cyan", None),
+            ("Amount", "bold", "right"),
+            ("Transactions", None, "right"),
+        ))
         for s in sources:
             table.add_row(s["source"], f"${s['total'] / 100:.2f}", str(s["cnt"]))
         console.print(table)
@@ -837,15 +1249,17 @@ def revenue(
 # ------------------------------------------------------------------
 
 
-@app.command()
+@app.command("dashboard")
 def dashboard(
     port: int = typer.Option(8420, "--port", "-p", help="Port to serve on"),
     host: str = typer.Option("127.0.0.1", "--host", help="Host to bind to"),
 ):
     """Launch the web dashboard."""
+    # Print first: importing FastAPI/uvicorn takes a noticeable moment.
+    console.print(f"[bold green]Starting dashboard at http://{host}:{port}...[/bold green]")
+
     from agent_company_ai.dashboard.server import run_dashboard
 
-    console.print(f"[bold green]Starting dashboard at http://{host}:{port}[/bold green]")
     run_dashboard(host=host, port=port, company=_selected_company)
 
 
@@ -854,7 +1268,7 @@ def dashboard(
 # ------------------------------------------------------------------
 
 
-@app.command()
+@app.command("roles")
 def roles():
     """List all available preset roles."""
     from agent_company_ai.config import list_available_roles
@@ -871,95 +1285,115 @@ def roles():
 
 # Preset company templates: maps a company type to a list of (role, name) pairs.
 # Order matters - first agent in each group is the leader, rest are reports.
-COMPANY_PRESETS: dict[str, dict] = {
-    "tech_startup": {
-        "description": "Tech Startup - small team building a software product",
-        "agents": [
-            ("ceo", "Alex"),
-            ("cto", "Jordan"),
-            ("developer", "Sam"),
-            ("developer", "Riley"),
-            ("marketer", "Morgan"),
-            ("project_manager", "Casey"),
-        ],
-    },
-    "agency": {
-        "description": "Digital Agency - client services, marketing, and creative",
-        "agents": [
-            ("ceo", "Alex"),
-            ("marketer", "Morgan"),
-            ("developer", "Sam"),
-            ("sales", "Taylor"),
-            ("project_manager", "Casey"),
-            ("support", "Jamie"),
-        ],
-    },
-    "ecommerce": {
-        "description": "E-commerce Business - online store with full ops",
-        "agents": [
-            ("ceo", "Alex"),
-            ("cto", "Jordan"),
-            ("developer", "Sam"),
-            ("marketer", "Morgan"),
-            ("sales", "Taylor"),
-            ("support", "Jamie"),
-            ("finance", "Drew"),
-        ],
-    },
-    "saas": {
-        "description": "SaaS Company - subscription software business",
-        "agents": [
-            ("ceo", "Alex"),
-            ("cto", "Jordan"),
-            ("developer", "Sam"),
-            ("developer", "Riley"),
-            ("marketer", "Morgan"),
-            ("sales", "Taylor"),
-            ("support", "Jamie"),
-            ("finance", "Drew"),
-            ("project_manager", "Casey"),
-        ],
-    },
-    "consulting": {
-        "description": "Consulting Firm - strategy and professional services",
-        "agents": [
-            ("ceo", "Alex"),
-            ("project_manager", "Casey"),
-            ("marketer", "Morgan"),
-            ("sales", "Taylor"),
-            ("finance", "Drew"),
-            ("hr", "Avery"),
-        ],
-    },
-    "content": {
-        "description": "Content / Media Company - publishing and content creation",
-        "agents": [
-            ("ceo", "Alex"),
-            ("marketer", "Morgan"),
-            ("developer", "Sam"),
-            ("project_manager", "Casey"),
-            ("support", "Jamie"),
-        ],
-    },
-    "full": {
-        "description": "Full Company - all departments staffed",
-        "agents": [
-            ("ceo", "Alex"),
-            ("cto", "Jordan"),
-            ("developer", "Sam"),
-            ("developer", "Riley"),
-            ("marketer", "Morgan"),
-            ("sales", "Taylor"),
-            ("support", "Jamie"),
-            ("finance", "Drew"),
-            ("hr", "Avery"),
-            ("project_manager", "Casey"),
-        ],
-    },
-}
+class _CompanyPreset(NamedTuple):
+    description: str
+    agents: tuple[tuple[str, str], ...]
+
+
+@functools.lru_cache(maxsize=1)
+def _company_presets() -> dict[str, _CompanyPreset]:
+    """Return the preset templates; built on first use by ``setup``."""
+    return {key: _CompanyPreset(p["description"], tuple(p["agents"])) for key, p in {
+        "tech_startup": {
+            "description": "Tech Startup - small team building a software product",
+            "agents": [
+                ("ceo", "Alex"),
+                ("cto", "Jordan"),
+                ("developer", "Sam"),
+                ("developer", "Riley"),
+                ("marketer", "Morgan"),
+                ("project_manager", "Casey"),
+            ],
+        },
+        "agency": {
+            "description": "Digital Agency - client services, marketing, and creative",
+            "agents": [
+                ("ceo", "Alex"),
+                ("marketer", "Morgan"),
+                ("developer", "Sam"),
+                ("sales", "Taylor"),
+                ("project_manager", "Casey"),
+                ("support", "Jamie"),
+            ],
+        },
+        "ecommerce": {
+            "description": "E-commerce Business - online store with full ops",
+            "agents": [
+                ("ceo", "Alex"),
+                ("cto", "Jordan"),
+                ("developer", "Sam"),
+                ("marketer", "Morgan"),
+                ("sales", "Taylor"),
+                ("support", "Jamie"),
+                ("finance", "Drew"),
+            ],
+        },
+        "saas": {
+            "description": "SaaS Company - subscription software business",
+            "agents": [
+                ("ceo", "Alex"),
+                ("cto", "Jordan"),
+                ("developer", "Sam"),
+                ("developer", "Riley"),
+                ("marketer", "Morgan"),
+                ("sales", "Taylor"),
+                ("support", "Jamie"),
+                ("finance", "Drew"),
+                ("project_manager", "Casey"),
+            ],
+        },
+        "consulting": {
+            "description": "Consulting Firm - strategy and professional services",
+            "agents": [
+                ("ceo", "Alex"),
+                ("project_manager", "Casey"),
+                ("marketer", "Morgan"),
+                ("sales", "Taylor"),
+                ("finance", "Drew"),
+                ("hr", "Avery"),
+            ],
+        },
+        "content": {
+            "description": "Content / Media Company - publishing and content creation",
+            "agents": [
+                ("ceo", "Alex"),
+                ("marketer", "Morgan"),
+                ("developer", "Sam"),
+                ("project_manager", "Casey"),
+                ("support", "Jamie"),
+            ],
+        },
+        "full": {
+            "description": "Full Company - all departments staffed",
+            "agents": [
+                ("ceo", "Alex"),
+                ("cto", "Jordan"),
+                ("developer", "Sam"),
+                ("developer", "Riley"),
+                ("marketer", "Morgan"),
+                ("sales", "Taylor"),
+                ("support", "Jamie"),
+                ("finance", "Drew"),
+                ("hr", "Avery"),
+                ("project_manager", "Casey"),
+            ],
+        },
+    }.items()}
+
+
+@functools.lru_cache(maxsize=1)
+def _preset_summaries() -> dict[str, tuple[int, str]]:
+    """Map each preset to ``(team_size, "role, role, ...")`` for ``setup --list``."""
+    return {
+        key: (
+            len(preset.agents),
+            ", ".join(sorted({role for role, _ in preset.agents})),
+        )
+        for key, preset in _company_presets().items()
+    }
 
 
-@app.command()
+@app.command("setup")
 def setup(
     company_type: str = typer.Argument(
         None,
@@ -981,22 +1415,23 @@ def setup(
       agent-company-ai setup saas --name "CloudCo" --provider anthropic --api-key sk-ant-...
       agent-company-ai setup --list
     """
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.tree import Tree
+
+    presets = _company_presets()
     if list_presets or company_type is None:
         console.print("[bold]Available company presets:[/bold]\n")
-        table = Table()
-        table.add_column("Preset", style="cyan bold")
-        table.add_column("Description")
-        table.add_column("Team Size", justify="right")
-        table.add_column("Roles")
-        for key, preset in COMPANY_PRESETS.items():
-            roles_list = [r for r, _ in preset["agents"]]
-            unique_roles = sorted(set(roles_list))
-            table.add_row(
-                key,
-                preset["description"],
-                str(len(preset["agents"])),
-                ", ".join(unique_roles),
-            )
+        table = _build_table(None, (
+            ("Preset", "cyan bold", None),
+            ("Description", None, None),
+            ("Team Size", None, "right"),
+            ("Roles", None, None),
+        ))
+        summaries = _preset_summaries()
+        for key, preset in presets.items():
+            team_size, roles = summaries[key]
+            table.add_row(key, preset.description, str(team_size), roles)
         console.print(table)
         if company_type is None:
             console.print(
@@ -1004,31 +1439,52 @@ def setup(
             )
         return
 
-    if company_type not in COMPANY_PRESETS:
+    if company_type not in presets:
         console.print(f"[red]Unknown preset '{company_type}'.[/red] Use --list to see options.")
         raise typer.Exit(1)
 
-    preset = COMPANY_PRESETS[company_type]
-    from agent_company_ai.core.company import Company
+    preset = presets[company_type]
+    Company = _Company()
 
     async def _setup():
-        # Init company if not already
-        from agent_company_ai.config import get_company_dir, save_config, LLMProviderConfig
+        from agent_company_ai.config import get_company_dir
         company_dir = get_company_dir(company=_selected_company)
+        # Held across the exists/init/load check and the hires, so two
+        # concurrent setups cannot both initialise or both hire.
+        async with _lock_for(company_dir):
+            return await _setup_locked(company_dir)
+
+    async def _setup_locked(company_dir):
+        # Init company if not already
         config_path = company_dir / "config.yaml"
 
-        if config_path.exists():
+        existed = config_path.exists()
+        if existed:
             company = await Company.load(company=_selected_company)
+        else:
+            company = await Company.init(name=company_name, company=_selected_company)
+        try:
+            return await _populate(company, existed, config_path)
+        finally:
+            await company.shutdown()
+
+    async def _populate(company, existed, config_path):
+        """Apply the preset to *company*; the caller shuts it down."""
+        import asyncio
+        from agent_company_ai.config import save_config, LLMProviderConfig
+
+        if existed:
             # Update name if different
             if company.config.name != company_name and company_name != "My AI Company":
                 company.config.name = company_name
                 save_config(company.config, config_path)
         else:
-            company = await Company.init(name=company_name, company=_selected_company)
             # Apply LLM config if api_key provided (non-interactive init)
             if api_key and provider:
-                full_preset = PROVIDER_PRESETS.get(provider, ("openai", None, None, None))
-                cfg_provider, cfg_base_url, cfg_default_model = full_preset[0], full_preset[1], full_preset[2]
+                full_preset = PROVIDER_PRESETS.get(provider, _DEFAULT_PROVIDER_PRESET)
+                cfg_provider, cfg_base_url, cfg_default_model = (
+                    full_preset.config_provider, full_preset.base_url, full_preset.model,
+                )
                 provider_config = LLMProviderConfig(
                     api_key=api_key,
                     model=model or cfg_default_model or "",
@@ -1044,56 +1500,75 @@ def setup(
                 from agent_company_ai.llm.router import LLMRouter
                 company.router = LLMRouter(company.config.llm)
 
+        skipped = [
+            (agent_name, role_name)
+            for role_name, agent_name in preset.agents
+            if agent_name in company.agents
+        ]
+        to_hire = [
+            (role_name, agent_name)
+            for role_name, agent_name in preset.agents
+            if agent_name not in company.agents
+        ]
+
+        # hire() awaits only its database writes, so overlap up to four at a
+        # time; results come back in preset order either way.
+        sem = asyncio.Semaphore(4)
+
+        async def _hire_one(role_name: str, agent_name: str) -> Exception | None:
+            async with sem:
+                try:
+                    await company.hire(
+                        role_name=role_name,
+                        agent_name=agent_name,
+                        provider=provider,
+                        model=model,
+                    )
+                except Exception as e:
+                    return e
+                return None
+
+        errors = await asyncio.gather(*(_hire_one(r, n) for r, n in to_hire))
         hired = []
-        skipped = []
-        for role_name, agent_name in preset["agents"]:
-            if agent_name in company.agents:
-                skipped.append((agent_name, role_name))
-                continue
-            try:
-                await company.hire(
-                    role_name=role_name,
-                    agent_name=agent_name,
-                    provider=provider,
-                    model=model,
-                )
+        for (role_name, agent_name), e in zip(to_hire, errors):
+            if e is None:
                 hired.append((agent_name, role_name))
-            except Exception as e:
+            else:
                 console.print(f"  [yellow]Warning:[/yellow] Could not hire {agent_name} ({role_name}): {e}")
 
         agents = company.list_agents()
         org = company.get_org_chart()
-        await company.shutdown()
         return hired, skipped, agents, org
 
-    with console.status(f"Setting up {company_name} ({preset['description']})..."):
+    with _status(f"Setting up {company_name} ({preset.description})..."):
         hired, skipped, agents, org = _run(_setup())
 
-    # Show results
-    console.print(Panel(
-        f"[bold green]{company_name}[/bold green] — {preset['description']}",
+    # Show results, rendered as one group in a single print
+    parts: list = [Panel(
+        f"[bold green]{company_name}[/bold green] — {preset.description}",
         title="Company Setup Complete",
         border_style="green",
-    ))
-
+    )]
     if hired:
-        console.print(f"\n[bold green]Hired {len(hired)} agents:[/bold green]")
-        for name, role in hired:
-            console.print(f"  [green]+[/green] [bold]{name}[/bold] as [cyan]{role}[/cyan]")
-
+        parts.append(f"\n[bold green]Hired {len(hired)} agents:[/bold green]")
+        parts.extend(
+            f"  [green]+[/green] [bold]{name}[/bold] as [cyan]{role}[/cyan]"
+            for name, role in hired
+        )
     if skipped:
-        console.print(f"\n[dim]Skipped {len(skipped)} (already exist):[/dim]")
-        for name, role in skipped:
-            console.print(f"  [dim]  {name} ({role})[/dim]")
+        parts.append(f"\n[dim]Skipped {len(skipped)} (already exist):[/dim]")
+        parts.extend(f"  [dim]  {name} ({role})[/dim]" for name, role in skipped)
 
-    # Print org chart
-    console.print()
+    # Org chart
     tree = Tree(f"[bold]{org['name']}[/bold] ({org.get('title', '')})")
     _build_tree(tree, org)
-    console.print(tree)
-
-    console.print(f"\n[dim]Next: agent-company-ai run \"Your goal here\"[/dim]")
-    console.print(f"[dim]Edit: agent-company-ai hire/fire/team to adjust the team[/dim]")
+    parts += [
+        "",
+        tree,
+        "\n[dim]Next: agent-company-ai run \"Your goal here\"[/dim]",
+        "[dim]Edit: agent-company-ai hire/fire/team to adjust the team[/dim]",
+    ]
+    console.print(Group(*parts))
 
 
 # ------------------------------------------------------------------
@@ -1101,42 +1576,111 @@ def setup(
 # ------------------------------------------------------------------
 
 
-@app.command()
+@app.command("companies")
 def companies():
     """List all companies in this directory."""
     from agent_company_ai.config import (
-        list_companies,
-        get_company_dir,
-        load_config,
+        get_root_dir,
+        load_all_company_configs,
         maybe_migrate_legacy_layout,
     )
 
     maybe_migrate_legacy_layout()
-    slugs = list_companies()
+    configs = load_all_company_configs()
 
-    if not slugs:
+    if not configs:
         console.print("[yellow]No companies found.[/yellow] Use 'agent-company-ai init' to create one.")
         return
 
-    table = Table(title="Companies")
-    table.add_column("Name", style="bold")
-    table.add_column("Slug", style="cyan")
-    table.add_column("Directory", style="dim")
-    table.add_column("Agents", justify="right")
+    table = _build_table("Companies", (
+        ("Name", "bold", None),
+        ("Slug", "cyan", None),
+        ("Directory", "dim", None),
+        ("Agents", None, "right"),
+    ))
 
-    for slug in slugs:
-        company_dir = get_company_dir(company=slug, create=False)
-        config_path = company_dir / "config.yaml"
+    root = get_root_dir()
+    for slug, cfg in configs.items():
+        if cfg is None:
+            name, agent_count = slug, "?"
+        else:
+            name, agent_count = cfg.name, str(len(cfg.agents))
+        table.add_row(name, slug, str(root / slug), agent_count)
+
+    _print_table(table)
+
+
+# ------------------------------------------------------------------
+# shell
+# ------------------------------------------------------------------
+
+
+@app.command("shell")
+def shell():
+    """Run several commands in one session, reusing the loaded company.
+
+    Each line is parsed like a normal command line (e.g. ``team``,
+    ``tasks``, ``hire developer --name Bob``).  The company is loaded once
+    and, with the event loop, stays alive between commands; a command that
+    fails is reported and the session carries on.  Type ``exit`` or press
+    Ctrl-D to quit.
+    """
+    global _in_shell
+    command = typer.main.get_command(app)
+    company_slug = _selected_company
+    console.print(
+        f"[bold]agent-company-ai shell[/bold] — company [cyan]{company_slug}[/cyan]. "
+        "Type 'exit' to quit."
+    )
+
+    _in_shell = True
+    try:
+        _shell_loop(command, company_slug)
+    finally:
+        _in_shell = False
+
+
+def _shell_loop(command, company_slug: str) -> None:
+    """Read and dispatch command lines until ``exit`` or end of input."""
+    import shlex
+
+    while True:
         try:
-            cfg = load_config(config_path)
-            agent_count = str(len(cfg.agents))
-            name = cfg.name
-        except Exception:
-            name = slug
-            agent_count = "?"
-        table.add_row(name, slug, str(company_dir), agent_count)
+            line = console.input("[bold cyan]> [/bold cyan]").strip()
+        except (EOFError, KeyboardInterrupt):
+            console.print()
+            break
+        if not line:
+            continue
+        if line in ("exit", "quit"):
+            break
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            continue
+        if args[0] == "shell":
+            console.print("[yellow]Already in a shell.[/yellow]")
+            continue
 
-    console.print(table)
+        try:
+            # A later -C/--company in the line still wins.
+            command.main(
+                ["-C", company_slug, *args],
+                prog_name="agent-company-ai",
+                standalone_mode=False,
+            )
+        except typer.Exit:
+            pass
+        except typer.Abort:
+            console.print("[yellow]Aborted.[/yellow]")
+        except Exception as e:
+            # Usage errors (from click, or the copy Typer vendors) print
+            # themselves with the usage line.
+            if callable(getattr(e, "show", None)):
+                e.show()
+            else:
+                console.print(f"[red]Error:[/red] {e}")
 
 
 # ------------------------------------------------------------------
@@ -1144,7 +1688,7 @@ def companies():
 # ------------------------------------------------------------------
 
 
-@app.command()
+@app.command("destroy")
 def destroy(
     company: str = typer.Option(
         None,
@@ -1154,8 +1698,8 @@ def destroy(
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompt"),
 ):
     """Permanently delete a company and all its data."""
-    import shutil
-    from agent_company_ai.config import get_company_dir, load_config, maybe_migrate_legacy_layout
+    from rich.text import Text
+    from agent_company_ai.config import get_company_dir, load_config_preview, maybe_migrate_legacy_layout
 
     target = company or _selected_company
     maybe_migrate_legacy_layout()
@@ -1171,33 +1715,123 @@ def destroy(
     agent_count = 0
     if config_path.exists():
         try:
-            cfg = load_config(config_path)
-            company_name = cfg.name
-            agent_count = len(cfg.agents)
+            company_name, agent_count = load_config_preview(config_path)
         except Exception:
             pass
 
-    console.print(f"\n[bold red]This will permanently delete:[/bold red]")
-    console.print(f"  Company: [bold]{company_name}[/bold] (slug: {target})")
-    console.print(f"  Agents:  {agent_count}")
-    console.print(f"  Path:    {company_dir}\n")
+    # Assembled from styled spans, so names and paths are never parsed as markup.
+    console.print(Text.assemble(
+        ("\nThis will permanently delete:\n", "bold red"),
+        "  Company: ", (company_name, "bold"), f" (slug: {target})\n",
+        f"  Agents:  {agent_count}\n",
+        f"  Path:    {company_dir}\n",
+    ))
 
     if not yes:
         typer.confirm("Are you sure?", abort=True)
 
-    # Gracefully shut down the company if possible
-    async def _shutdown():
-        try:
-            from agent_company_ai.core.company import Company
-            co = await Company.load(company=target)
-            await co.shutdown()
-        except Exception:
-            pass  # DB might be corrupted — that's fine, we're deleting anyway
+    # Only a company loaded in this process holds resources worth closing;
+    # loading one from disk just to shut it down again would be wasted work.
+    cached = _company_cache.pop(config_path.absolute(), None)
+    if cached is None:
+        _fast_rmtree(company_dir)
+    else:
+        async def _shutdown():
+            try:
+                await cached[1].shutdown()
+            except Exception:
+                pass  # DB might be corrupted — that's fine, we're deleting anyway
+
+        # Walk the directory in a worker thread while the shutdown runs; the
+        # delete then reuses the walk instead of traversing the tree again.
+        async def _shutdown_and_walk():
+            import asyncio
+            shutdown = asyncio.create_task(_shutdown())
+            walked = await _to_thread(_walk_for_delete, company_dir)
+            await shutdown
+            return walked
+
+        _fast_rmtree(company_dir, _run(_shutdown_and_walk()))
+    console.print(Text.assemble("Company '", company_name, "' destroyed.", style="bold green"))
+
+
+def _walk_for_delete(path: Path) -> tuple[list, list] | None:
+    """Open every directory under *path* and list the files to unlink.
+
+    Returns ``(dirs, files)``: directories as ``(parent_fd, name, fd)`` in
+    top-down order and files as ``(dir_fd, name)``.  Returns *None* when
+    the platform lacks ``dir_fd`` support or the walk fails, in which case
+    callers should fall back to :func:`shutil.rmtree`.  The returned
+    directory fds stay open until :func:`_fast_rmtree` closes them.
+    """
+    if not (os.unlink in os.supports_dir_fd and os.scandir in os.supports_fd):
+        return None
+
+    dir_flags = os.O_RDONLY | os.O_DIRECTORY | getattr(os, "O_NOFOLLOW", 0)
+    dirs: list[tuple[int | None, str | None, int]] = []
+    files: list[tuple[int, str]] = []
+    try:
+        dirs.append((None, None, os.open(path, dir_flags)))
+        stack = [dirs[0][2]]
+        while stack:
+            fd = stack.pop()
+            with os.scandir(fd) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        sub = os.open(entry.name, dir_flags, dir_fd=fd)
+                        dirs.append((fd, entry.name, sub))
+                        stack.append(sub)
+                    else:
+                        files.append((fd, entry.name))
+    except OSError:
+        for _, _, fd in dirs:
+            os.close(fd)
+        return None
+    return dirs, files
+
+
+def _fast_rmtree(path: Path, walked: tuple[list, list] | None = None) -> None:
+    """Delete *path* and everything under it, unlinking files in parallel.
+
+    Removes entries through the ``*at`` syscalls (``dir_fd=``) using the
+    directory fds from *walked* (or a fresh :func:`_walk_for_delete`), so
+    no path is resolved twice. Files that vanished since the walk are
+    ignored. Falls back to :func:`shutil.rmtree` when no walk is available
+    or anything else goes wrong mid-way.
+    """
+    import shutil
+
+    if walked is None:
+        walked = _walk_for_delete(path)
+    if walked is None:
+        shutil.rmtree(path)
+        return
 
-    _run(_shutdown())
+    from concurrent.futures import ThreadPoolExecutor
 
-    shutil.rmtree(company_dir)
-    console.print(f"[bold green]Company '{company_name}' destroyed.[/bold green]")
+    def _unlink(dir_fd: int, name: str) -> None:
+        try:
+            os.unlink(name, dir_fd=dir_fd)
+        except FileNotFoundError:
+            pass
+
+    dirs, files = walked
+    try:
+        if files:
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+                for future in [pool.submit(_unlink, fd, name) for fd, name in files]:
+                    future.result()
+        while dirs:
+            parent_fd, name, fd = dirs.pop()
+            os.close(fd)
+            if parent_fd is not None:
+                os.rmdir(name, dir_fd=parent_fd)
+        os.rmdir(path)
+    except OSError:
+        for _, _, fd in dirs:
+            os.close(fd)
+        if os.path.lexists(path):
+            shutil.rmtree(path)
 
 
 # ------------------------------------------------------------------
@@ -1222,10 +1856,11 @@ def pe_templates():
         console.print("[yellow]No templates found.[/yellow]")
         return
 
-    table = Table(title="ProfitEngine Templates")
-    table.add_column("Name", style="cyan bold")
-    table.add_column("Display Name")
-    table.add_column("Description")
+    table = _build_table("ProfitEngine Templates", (
+        ("Name", "cyan bold", None),
+        ("Display Name", None, None),
+        ("Description", None, None),
+    ))
 
     for name in names:
         tmpl = load_profit_engine_template(name)
@@ -1243,20 +1878,13 @@ def pe_setup(
     Optionally start from a preset template, then customize each field.
     The result is saved to config.yaml under the profit_engine section.
     """
+    from rich.panel import Panel
     from agent_company_ai.config import (
-        load_config, save_config, get_company_dir,
-        load_profit_engine_template, list_profit_engine_templates,
-        ProfitEngineConfig, maybe_migrate_legacy_layout,
+        save_config, load_profit_engine_template, list_profit_engine_templates,
+        ProfitEngineConfig,
     )
 
-    maybe_migrate_legacy_layout()
-    company_dir = get_company_dir(company=_selected_company, create=False)
-    config_path = company_dir / "config.yaml"
-    if not config_path.exists():
-        console.print("[red]No company found.[/red] Run 'agent-company-ai init' first.")
-        raise typer.Exit(1)
-
-    config = load_config(config_path)
+    config_path, config = _load_company_config()
 
     # Template selection
     defaults: dict[str, str] = {}
@@ -1328,16 +1956,10 @@ def pe_setup(
 @profit_engine_app.command("show")
 def pe_show():
     """Display the current business model DNA."""
-    from agent_company_ai.config import load_config, get_company_dir, maybe_migrate_legacy_layout
+    from rich.console import Group
+    from rich.panel import Panel
 
-    maybe_migrate_legacy_layout()
-    company_dir = get_company_dir(company=_selected_company, create=False)
-    config_path = company_dir / "config.yaml"
-    if not config_path.exists():
-        console.print("[red]No company found.[/red] Run 'agent-company-ai init' first.")
-        raise typer.Exit(1)
-
-    config = load_config(config_path)
+    _, config = _load_company_config()
     pe = config.profit_engine
 
     if not pe.enabled:
@@ -1349,19 +1971,21 @@ def pe_show():
         console.print("[yellow]ProfitEngine is enabled but all fields are empty.[/yellow]")
         return
 
-    console.print(Panel(dna, title="ProfitEngine — Business DNA", border_style="cyan"))
-
     # Also show raw field values
-    table = Table(title="Field Values")
-    table.add_column("Field", style="bold")
-    table.add_column("Value")
+    table = _build_table("Field Values", (
+        ("Field", "bold", None),
+        ("Value", None, None),
+    ))
     for field_name in [
         "mission", "revenue_streams", "target_customers", "pricing_model",
         "competitive_edge", "key_metrics", "cost_priorities", "additional_context",
     ]:
         val = getattr(pe, field_name, "")
         table.add_row(field_name, val[:120] + ("..." if len(val) > 120 else "") if val else "[dim]empty[/dim]")
-    console.print(table)
+    console.print(Group(
+        Panel(dna, title="ProfitEngine — Business DNA", border_style="cyan"),
+        table,
+    ))
 
 
 @profit_engine_app.command("edit")
@@ -1369,7 +1993,7 @@ def pe_edit(
     field: str = typer.Argument(help="Field to edit: mission, revenue_streams, target_customers, pricing_model, competitive_edge, key_metrics, cost_priorities, additional_context"),
 ):
     """Edit a single ProfitEngine field."""
-    from agent_company_ai.config import load_config, save_config, get_company_dir, maybe_migrate_legacy_layout
+    from agent_company_ai.config import save_config
 
     valid_fields = [
         "mission", "revenue_streams", "target_customers", "pricing_model",
@@ -1379,14 +2003,7 @@ def pe_edit(
         console.print(f"[red]Unknown field '{field}'.[/red] Valid fields: {', '.join(valid_fields)}")
         raise typer.Exit(1)
 
-    maybe_migrate_legacy_layout()
-    company_dir = get_company_dir(company=_selected_company, create=False)
-    config_path = company_dir / "config.yaml"
-    if not config_path.exists():
-        console.print("[red]No company found.[/red] Run 'agent-company-ai init' first.")
-        raise typer.Exit(1)
-
-    config = load_config(config_path)
+    config_path, config = _load_company_config()
     current = getattr(config.profit_engine, field, "")
 
     console.print(f"[bold]Editing: {field}[/bold]")
@@ -1408,16 +2025,9 @@ def pe_edit(
 @profit_engine_app.command("disable")
 def pe_disable():
     """Disable ProfitEngine — removes DNA from all agent prompts."""
-    from agent_company_ai.config import load_config, save_config, get_company_dir, maybe_migrate_legacy_layout
-
-    maybe_migrate_legacy_layout()
-    company_dir = get_company_dir(company=_selected_company, create=False)
-    config_path = company_dir / "config.yaml"
-    if not config_path.exists():
-        console.print("[red]No company found.[/red]")
-        raise typer.Exit(1)
+    from agent_company_ai.config import save_config
 
-    config = load_config(config_path)
+    config_path, config = _load_company_config()
     config.profit_engine.enabled = False
     save_config(config, config_path)
     console.print("[green]ProfitEngine disabled.[/green] Business DNA will no longer be injected into agent prompts.")
@@ -1436,10 +2046,24 @@ wallet_app = typer.Typer(
 app.add_typer(wallet_app, name="wallet")
 
 
+def _readonly_wallet_manager() -> WalletManager:
+    """Build a WalletManager for read-only commands without loading the company.
+
+    Address and balance lookups only need the keystore and RPC provider,
+    so the agents, LLM router and tools are skipped.  The database is
+    returned unconnected; callers that query it connect and close it.
+    """
+    from agent_company_ai.storage.database import get_database
+    from agent_company_ai.wallet.manager import WalletManager
+
+    company_dir = _existing_company_dir()
+    return WalletManager(company_dir / "wallet", get_database(company_dir))
+
+
 @wallet_app.command("create")
 def wallet_create():
     """Generate a new Ethereum wallet with encrypted keystore."""
-    from agent_company_ai.core.company import Company
+    from rich.panel import Panel
     from agent_company_ai.config import save_config
 
     password = console.input("[bold]Set wallet password: [/bold]", password=True)
@@ -1449,19 +2073,18 @@ def wallet_create():
         raise typer.Exit(1)
 
     async def _create():
-        company = await Company.load(company=_selected_company)
-        if company.wallet_manager.has_wallet():
-            console.print("[yellow]Wallet already exists.[/yellow]")
-            addr = company.wallet_manager.address
-            await company.shutdown()
-            return addr, False
-
-        addr = company.wallet_manager.create(password)
-        company.config.wallet.enabled = True
-        save_config(company.config, company.company_dir / "config.yaml")
-        await company.wallet_manager.register_wallet_in_db()
-        await company.shutdown()
-        return addr, True
+        # Locked before loading, so a concurrent create is seen by has_wallet().
+        async with _lock_for(_existing_company_dir()):
+            async with _company_session(_selected_company) as company:
+                if company.wallet_manager.has_wallet():
+                    console.print("[yellow]Wallet already exists.[/yellow]")
+                    return company.wallet_manager.address, False
+
+                addr = company.wallet_manager.create(password)
+                company.config.wallet.enabled = True
+                save_config(company.config, company.company_dir / "config.yaml")
+                await company.wallet_manager.register_wallet_in_db()
+                return addr, True
 
     addr, created = _run(_create())
 
@@ -1483,15 +2106,9 @@ def wallet_balance(
     chain: str = typer.Option(None, "--chain", "-c", help="Chain name (ethereum, base, arbitrum, polygon)"),
 ):
     """Show native token balances across all supported chains."""
-    from agent_company_ai.core.company import Company
-
-    async def _balance():
-        company = await Company.load(company=_selected_company)
-        result = company.wallet_manager.get_balance(chain_name=chain)
-        await company.shutdown()
-        return result
 
-    result = _run(_balance())
+    manager = _readonly_wallet_manager()
+    result = _run(manager.get_balance_async(chain_name=chain))
 
     if "error" in result:
         console.print(f"[red]{result['error']}[/red]")
@@ -1506,11 +2123,12 @@ def wallet_balance(
             console.print(f"[bold]{chain}:[/bold] {info['balance']} {info['symbol']}")
     else:
         # All chains table
-        table = Table(title="Wallet Balances")
-        table.add_column("Chain", style="cyan")
-        table.add_column("Balance", justify="right")
-        table.add_column("Symbol")
-        table.add_column("Status", style="dim")
+        table = _build_table("Wallet Balances", (
+            ("Chain", "cyan", None),
+            ("Balance", None, "right"),
+            ("Symbol", None, None),
+            ("Status", "dim", None),
+        ))
 
         for name, info in result.items():
             err = info.get("error")
@@ -1526,15 +2144,9 @@ def wallet_balance(
 @wallet_app.command("address")
 def wallet_address():
     """Show the company wallet address."""
-    from agent_company_ai.core.company import Company
+    from rich.panel import Panel
 
-    async def _address():
-        company = await Company.load(company=_selected_company)
-        addr = company.wallet_manager.address
-        await company.shutdown()
-        return addr
-
-    addr = _run(_address())
+    addr = _readonly_wallet_manager().address
     if addr is None:
         console.print("[yellow]No wallet found.[/yellow] Run 'agent-company-ai wallet create' first.")
         raise typer.Exit(1)
@@ -1553,7 +2165,7 @@ def wallet_send(
     chain: str = typer.Option("ethereum", "--chain", "-c", help="Chain to send on"),
 ):
     """Send native tokens (human-initiated). Requires password confirmation."""
-    from agent_company_ai.core.company import Company
+    from rich.panel import Panel
     from agent_company_ai.wallet.chains import get_chain
 
     chain_info = get_chain(chain)
@@ -1566,21 +2178,15 @@ def wallet_send(
     password = console.input("[bold]Wallet password: [/bold]", password=True)
 
     async def _send():
-        company = await Company.load(company=_selected_company)
         from agent_company_ai.wallet.keystore import decrypt_key
-        try:
+        async with _company_session(_selected_company) as company:
             key = decrypt_key(company.wallet_dir, password)
-            tx_hash = company.wallet_manager.provider.send_transaction(
+            return company.wallet_manager.provider.send_transaction(
                 private_key=key,
                 to_address=to,
                 amount_ether=amount,
                 chain_name=chain,
             )
-        except Exception as e:
-            await company.shutdown()
-            raise e
-        await company.shutdown()
-        return tx_hash
 
     try:
         tx_hash = _run(_send())
@@ -1595,18 +2201,53 @@ def wallet_send(
         raise typer.Exit(1)
 
 
+_PAYMENT_STATUS_COLORS = {
+    "pending": "yellow", "approved": "blue", "rejected": "red",
+    "sent": "green", "failed": "red",
+}
+# Pre-rendered "[color]status[/color]" markup for each known status.
+_PAYMENT_STATUS_MARKUP = {
+    status: f"[{color}]{status}[/{color}]" for status, color in _PAYMENT_STATUS_COLORS.items()
+}
+# The payment_queue columns the payments table shows.
+_PAYMENT_LIST_COLUMNS = (
+    "id", "amount", "token", "chain", "to_address", "status", "requested_by", "reason",
+)
+
+
+def _parse_date(value: str | None):
+    """Option callback: parse an ISO date (``YYYY-MM-DD``) into a ``datetime.date``."""
+    if value is None:
+        return None
+    import datetime
+
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise typer.BadParameter(f"{value!r} is not a date; use YYYY-MM-DD.") from None
+
+
 @wallet_app.command("payments")
 def wallet_payments(
     status: str = typer.Option(None, "--status", "-s", help="Filter by status (pending, approved, rejected, sent, failed)"),
+    limit: int = typer.Option(None, "--limit", "-n", min=1, help="Show at most this many of the newest payments (default: all)"),
+    since: str = typer.Option(
+        None, "--since", callback=_parse_date,
+        help="Only payments created on or after this date (YYYY-MM-DD)",
+    ),
 ):
     """Show the payment approval queue."""
-    from agent_company_ai.core.company import Company
+
+    manager = _readonly_wallet_manager()
 
     async def _payments():
-        company = await Company.load(company=_selected_company)
-        payments = await company.wallet_manager.list_payments(status=status)
-        await company.shutdown()
-        return payments
+        await manager.db.connect()
+        try:
+            return await manager.list_payments(
+                status=status, limit=limit, since=since, columns=_PAYMENT_LIST_COLUMNS,
+            )
+        finally:
+            await manager.db.close()
 
     payments = _run(_payments())
 
@@ -1614,35 +2255,32 @@ def wallet_payments(
         console.print("[dim]No payments in queue.[/dim]")
         return
 
-    table = Table(title="Payment Queue")
-    table.add_column("ID", style="dim")
-    table.add_column("Amount", justify="right")
-    table.add_column("Token")
-    table.add_column("Chain", style="cyan")
-    table.add_column("To", style="dim")
-    table.add_column("Status")
-    table.add_column("Requested By")
-    table.add_column("Reason")
-
-    status_colors = {
-        "pending": "yellow", "approved": "blue", "rejected": "red",
-        "sent": "green", "failed": "red",
-    }
+    table = _build_table("Payment Queue", (
+        ("ID", "dim", None),
+        ("Amount", None, "right"),
+        ("Token", None, None),
+        ("Chain", "cyan", None),
+        ("To", "dim", None),
+        ("Status", None, None),
+        ("Requested By", None, None),
+        ("Reason", None, None),
+    ))
 
     for p in payments:
-        color = status_colors.get(p["status"], "white")
         table.add_row(
             p["id"],
             p["amount"],
             p["token"],
             p["chain"],
             p["to_address"][:12] + "...",
-            f"[{color}]{p['status']}[/{color}]",
-            p.get("requested_by", "-") or "-",
-            (p.get("reason", "") or "")[:40],
+            _PAYMENT_STATUS_MARKUP.get(p["status"]) or f"[white]{p['status']}[/white]",
+            p["requested_by"] or "-",
+            (p["reason"] or "")[:40],
         )
 
-    console.print(table)
+    _print_table(table)
+    if limit is not None and len(payments) == limit:
+        console.print(f"[dim]Showing the {limit} newest; use --limit to see more.[/dim]")
 
 
 @wallet_app.command("approve")
@@ -1650,55 +2288,59 @@ def wallet_approve(
     payment_id: str = typer.Argument(help="Payment ID to approve"),
 ):
     """Approve and send a pending payment."""
-    from agent_company_ai.core.company import Company
+    from rich.panel import Panel
+    Company = _Company()
 
     async def _get_payment():
         company = await Company.load(company=_selected_company)
-        payment = await company.wallet_manager.get_payment(payment_id)
+        try:
+            payment = await company.wallet_manager.get_payment(payment_id)
+        except BaseException:
+            await company.shutdown()
+            raise
         return company, payment
 
     company_inst, payment = _run(_get_payment())
+    try:
+        if payment is None:
+            console.print(f"[red]Payment {payment_id} not found.[/red]")
+            raise typer.Exit(1)
 
-    if payment is None:
-        console.print(f"[red]Payment {payment_id} not found.[/red]")
-        raise typer.Exit(1)
-
-    if payment["status"] != "pending":
-        console.print(f"[yellow]Payment is '{payment['status']}', not pending.[/yellow]")
-        raise typer.Exit(1)
+        if payment["status"] != "pending":
+            console.print(f"[yellow]Payment is '{payment['status']}', not pending.[/yellow]")
+            raise typer.Exit(1)
 
-    console.print(Panel(
-        f"Amount:  [bold]{payment['amount']} {payment['token']}[/bold]\n"
-        f"Chain:   {payment['chain']}\n"
-        f"To:      {payment['to_address']}\n"
-        f"Reason:  {payment.get('reason', 'N/A')}\n"
-        f"By:      {payment.get('requested_by', 'N/A')}",
-        title=f"Payment {payment_id}",
-    ))
+        console.print(Panel(
+            f"Amount:  [bold]{payment['amount']} {payment['token']}[/bold]\n"
+            f"Chain:   {payment['chain']}\n"
+            f"To:      {payment['to_address']}\n"
+            f"Reason:  {payment.get('reason', 'N/A')}\n"
+            f"By:      {payment.get('requested_by', 'N/A')}",
+            title=f"Payment {payment_id}",
+        ))
 
-    typer.confirm("Approve and send this payment?", abort=True)
-    password = console.input("[bold]Wallet password: [/bold]", password=True)
+        typer.confirm("Approve and send this payment?", abort=True)
+        password = console.input("[bold]Wallet password: [/bold]", password=True)
 
-    async def _approve():
-        # Reuse the loaded company
-        tx_hash = await company_inst.wallet_manager.approve_and_send(payment_id, password)
-        await company_inst.shutdown()
-        return tx_hash
+        async def _approve():
+            # Reuse the loaded company
+            return await company_inst.wallet_manager.approve_and_send(payment_id, password)
 
-    try:
-        tx_hash = _run(_approve())
-        from agent_company_ai.wallet.chains import get_chain
-        chain_info = get_chain(payment["chain"])
-        console.print(Panel(
-            f"[bold green]Payment approved and sent![/bold green]\n\n"
-            f"Tx: [cyan]{tx_hash}[/cyan]\n"
-            f"Explorer: {chain_info.explorer_url}/tx/{tx_hash}",
-            title="Payment Sent",
-        ))
-    except Exception as e:
-        console.print(f"[red]Failed: {e}[/red]")
+        try:
+            tx_hash = _run(_approve())
+            from agent_company_ai.wallet.chains import get_chain
+            chain_info = get_chain(payment["chain"])
+            console.print(Panel(
+                f"[bold green]Payment approved and sent![/bold green]\n\n"
+                f"Tx: [cyan]{tx_hash}[/cyan]\n"
+                f"Explorer: {chain_info.explorer_url}/tx/{tx_hash}",
+                title="Payment Sent",
+            ))
+        except Exception as e:
+            console.print(f"[red]Failed: {e}[/red]")
+            raise typer.Exit(1)
+    finally:
         _run(company_inst.shutdown())
-        raise typer.Exit(1)
 
 
 @wallet_app.command("reject")
@@ -1706,12 +2348,10 @@ def wallet_reject(
     payment_id: str = typer.Argument(help="Payment ID to reject"),
 ):
     """Reject a pending payment."""
-    from agent_company_ai.core.company import Company
 
     async def _reject():
-        company = await Company.load(company=_selected_company)
-        await company.wallet_manager.reject_payment(payment_id)
-        await company.shutdown()
+        async with _company_session(_selected_company) as company:
+            await company.wallet_manager.reject_payment(payment_id)
 
     try:
         _run(_reject())
@@ -7,14 +7,38 @@ with the package.
 
 from __future__ import annotations
 
+import functools
 import os
 import re
-import shutil
 from pathlib import Path
-from typing import Optional
-
-import yaml
-from pydantic import BaseModel, Field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from importlib.resources.abc import Traversable
+
+    import yaml
+
+    from agent_company_ai.config_models import (
+        AgentConfig,
+        AutonomousConfig,
+        CalcomConfig,
+        CompanyConfig,
+        DashboardConfig,
+        EmailConfig,
+        GumroadConfig,
+        IntegrationsConfig,
+        InvoiceConfig,
+        LandingPageConfig,
+        LLMConfig,
+        LLMProviderConfig,
+        ProfitEngineConfig,
+        RateLimitConfig,
+        StripeConfig,
+        TwitterConfig,
+        VercelConfig,
+        WalletConfig,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -30,255 +54,90 @@ def _expand_env_vars(value: str) -> str:
     If the variable is not set the placeholder is left as-is so that
     validation can catch it later.
     """
+    # Almost no config strings hold a placeholder; skip the regex for those.
+    if "${" not in value:
+        return value
+    return _ENV_VAR_RE.sub(_env_var_value, value)
 
-    def _replace(match: re.Match) -> str:
-        var_name = match.group(1)
-        return os.environ.get(var_name, match.group(0))
-
-    return _ENV_VAR_RE.sub(_replace, value)
-
-
-def _expand_env_recursive(obj: object) -> object:
-    """Walk an arbitrary nested structure and expand env vars in strings."""
-    if isinstance(obj, str):
-        return _expand_env_vars(obj)
-    if isinstance(obj, dict):
-        return {k: _expand_env_recursive(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_expand_env_recursive(item) for item in obj]
-    return obj
-
-
-# ---------------------------------------------------------------------------
-# Pydantic v2 models
-# ---------------------------------------------------------------------------
-
-
-class LLMProviderConfig(BaseModel):
-    """Configuration for a single LLM provider (Anthropic, OpenAI, etc.)."""
-
-    api_key: str = ""
-    model: str = ""
-    base_url: Optional[str] = None  # For OpenAI-compatible endpoints
-    max_tokens: int = 4096
-
-
-class LLMConfig(BaseModel):
-    """Top-level LLM configuration that can hold multiple providers."""
-
-    default_provider: str = "anthropic"
-    anthropic: Optional[LLMProviderConfig] = None
-    openai: Optional[LLMProviderConfig] = None
-
-
-class AgentConfig(BaseModel):
-    """Configuration for a single agent in the company."""
-
-    name: str
-    role: str
-    provider: Optional[str] = None  # Override LLMConfig.default_provider
-    model: Optional[str] = None  # Override the provider's default model
-
-
-class DashboardConfig(BaseModel):
-    """Web dashboard settings."""
-
-    port: int = 8420
-    host: str = "127.0.0.1"
-
-
-class AutonomousConfig(BaseModel):
-    """Limits and budgets for autonomous (goal-driven) mode."""
-
-    max_cycles: int = 5             # CEO review-and-replan cycles
-    max_waves_per_cycle: int = 10   # delegation waves within one cycle
-    max_agent_iterations: int = 25  # tool-call loops per agent per task
-    max_total_tasks: int = 50       # hard cap on total tasks created
-    max_time_seconds: int = 3600    # 1 hour wall-clock timeout (0 = unlimited)
-    max_cost_usd: float = 10.0     # per-run spending cap in USD (0 = unlimited)
-    daily_budget_usd: float = 20.0  # rolling 24-hour budget in USD (0 = unlimited)
-
-
-class WalletConfig(BaseModel):
-    """Blockchain wallet settings."""
 
-    enabled: bool = False
-    default_chain: str = "ethereum"
+def _env_var_value(match: re.Match[str]) -> str:
+    return os.environ.get(match.group(1), match.group(0))
 
 
-class ProfitEngineConfig(BaseModel):
-    """Business DNA — defines how the company earns money and survives.
+def _expand_env_in_place(data: object) -> None:
+    """Expand env vars in every string of a freshly parsed document, in place.
 
-    When ``enabled`` is *True* and at least one field is non-empty, the
-    formatted DNA string is injected into every agent's system prompt and
-    into the CEO's autonomous goal loop.
+    Walks nested dicts and lists with an explicit stack and only writes back
+    strings that actually changed, so no containers are rebuilt.
     """
-
-    enabled: bool = False
-    mission: str = ""
-    revenue_streams: str = ""
-    target_customers: str = ""
-    pricing_model: str = ""
-    competitive_edge: str = ""
-    key_metrics: str = ""
-    cost_priorities: str = ""
-    additional_context: str = ""
-
-    def format_dna(self) -> str:
-        """Format the business DNA into a prompt-ready string.
-
-        Returns an empty string if the engine is disabled or every field is
-        blank, so callers can simply check truthiness.
-        """
-        if not self.enabled:
-            return ""
-
-        sections: list[str] = []
-        _fields = [
-            ("Mission", self.mission),
-            ("Revenue Streams", self.revenue_streams),
-            ("Target Customers", self.target_customers),
-            ("Pricing Model", self.pricing_model),
-            ("Competitive Edge", self.competitive_edge),
-            ("Key Metrics", self.key_metrics),
-            ("Cost Priorities", self.cost_priorities),
-            ("Additional Context", self.additional_context),
-        ]
-        for label, value in _fields:
-            if value.strip():
-                sections.append(f"- **{label}:** {value.strip()}")
-
-        if not sections:
-            return ""
-
-        return (
-            "\n\n--- COMPANY BUSINESS DNA (ProfitEngine) ---\n"
-            "The following defines how this company earns money and what matters most. "
-            "Factor this into every decision, recommendation, and deliverable.\n\n"
-            + "\n".join(sections)
-            + "\n--- END BUSINESS DNA ---"
-        )
-
-
-class RateLimitConfig(BaseModel):
-    """Rate limits for external service integrations."""
-
-    emails_per_hour: int = 20
-    emails_per_day: int = 100
-    payment_links_per_day: int = 10
-    max_payment_amount_usd: float = 500.0
-    tweets_per_day: int = 17          # Free tier is very restrictive
-    deploys_per_day: int = 50
-    gumroad_daily: int = 50
-    invoices_daily: int = 50
-    bookings_daily: int = 20
-    prospects_per_hour: int = 30
-    prospects_per_day: int = 200
-    browse_per_hour: int = 60
-    browse_per_day: int = 500
-
-
-class EmailConfig(BaseModel):
-    """Email sending configuration (Resend or SendGrid)."""
-
-    enabled: bool = False
-    provider: str = "resend"          # "resend" or "sendgrid"
-    api_key: str = ""                 # ${RESEND_API_KEY} or ${SENDGRID_API_KEY}
-    from_address: str = ""
-    from_name: str = ""
-    reply_to: str = ""
-
-
-class StripeConfig(BaseModel):
-    """Stripe payment integration configuration."""
-
-    enabled: bool = False
-    api_key: str = ""                 # ${STRIPE_SECRET_KEY}
-
-
-class LandingPageConfig(BaseModel):
-    """Landing page generator configuration."""
-
-    enabled: bool = False
-    serve_port: int = 8421
-    output_dir: str = "landing_pages"
-
-
-class TwitterConfig(BaseModel):
-    """Twitter/X API configuration for publishing social posts."""
-
-    enabled: bool = False
-    api_key: str = ""              # ${TWITTER_API_KEY}
-    api_secret: str = ""           # ${TWITTER_API_SECRET}
-    access_token: str = ""         # ${TWITTER_ACCESS_TOKEN}
-    access_token_secret: str = ""  # ${TWITTER_ACCESS_TOKEN_SECRET}
-
-
-class VercelConfig(BaseModel):
-    """Vercel deployment configuration for landing pages."""
-
-    enabled: bool = False
-    token: str = ""                # ${VERCEL_TOKEN}
-    project_name: str = ""         # optional: sets subdomain prefix
-
-
-class GumroadConfig(BaseModel):
-    """Gumroad digital product sales configuration."""
-
-    enabled: bool = False
-    access_token: str = ""           # ${GUMROAD_ACCESS_TOKEN}
-
-
-class InvoiceConfig(BaseModel):
-    """Invoice generator configuration."""
-
-    enabled: bool = False
-    company_name: str = ""
-    company_address: str = ""
-    payment_instructions: str = ""
-    currency: str = "USD"
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            items = node.items()
+        elif isinstance(node, list):
+            items = enumerate(node)
+        else:
+            continue
+        for key, value in items:
+            if isinstance(value, str):
+                if "${" in value:
+                    expanded = _ENV_VAR_RE.sub(_env_var_value, value)
+                    if expanded != value:
+                        node[key] = expanded
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
 
 
-class CalcomConfig(BaseModel):
-    """Cal.com paid booking configuration."""
-
-    enabled: bool = False
-    api_key: str = ""                # ${CALCOM_API_KEY}
-    default_duration: int = 30
-
-
-class IntegrationsConfig(BaseModel):
-    """External service integrations."""
-
-    email: EmailConfig = Field(default_factory=EmailConfig)
-    stripe: StripeConfig = Field(default_factory=StripeConfig)
-    landing_page: LandingPageConfig = Field(default_factory=LandingPageConfig)
-    twitter: TwitterConfig = Field(default_factory=TwitterConfig)
-    vercel: VercelConfig = Field(default_factory=VercelConfig)
-    gumroad: GumroadConfig = Field(default_factory=GumroadConfig)
-    invoice: InvoiceConfig = Field(default_factory=InvoiceConfig)
-    calcom: CalcomConfig = Field(default_factory=CalcomConfig)
-    rate_limits: RateLimitConfig = Field(default_factory=RateLimitConfig)
-
-
-class CompanyConfig(BaseModel):
-    """Root configuration object representing the entire company."""
+# ---------------------------------------------------------------------------
+# Pydantic v2 models (defined in config_models, imported on first access)
+# ---------------------------------------------------------------------------
 
-    name: str = "My AI Company"
-    llm: LLMConfig = Field(default_factory=LLMConfig)
-    agents: list[AgentConfig] = Field(default_factory=list)
-    dashboard: DashboardConfig = Field(default_factory=DashboardConfig)
-    autonomous: AutonomousConfig = Field(default_factory=AutonomousConfig)
-    wallet: WalletConfig = Field(default_factory=WalletConfig)
-    profit_engine: ProfitEngineConfig = Field(default_factory=ProfitEngineConfig)
-    integrations: IntegrationsConfig = Field(default_factory=IntegrationsConfig)
+_MODEL_NAMES = frozenset({
+    "LLMProviderConfig",
+    "LLMConfig",
+    "AgentConfig",
+    "DashboardConfig",
+    "AutonomousConfig",
+    "WalletConfig",
+    "ProfitEngineConfig",
+    "RateLimitConfig",
+    "EmailConfig",
+    "StripeConfig",
+    "LandingPageConfig",
+    "TwitterConfig",
+    "VercelConfig",
+    "GumroadConfig",
+    "InvoiceConfig",
+    "CalcomConfig",
+    "IntegrationsConfig",
+    "CompanyConfig",
+})
+
+
+def __getattr__(name: str):
+    if name in _MODEL_NAMES:
+        from agent_company_ai import config_models
+
+        return getattr(config_models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ---------------------------------------------------------------------------
 # Public helpers
 # ---------------------------------------------------------------------------
 
-_ROLES_DIR = Path(__file__).resolve().parent / "roles"
+# Package-data directories, read through importlib.resources so they also
+# load from zipped installs.
+_ROLES_DIR = "roles"
+
+
+# Byte table for slugify(): a-z and 0-9 map to themselves, everything else
+# (including the "?" that stands in for each non-ASCII character) to "-".
+_SLUG_TABLE = bytes(
+    c if chr(c) in "abcdefghijklmnopqrstuvwxyz0123456789" else ord("-")
+    for c in range(256)
+)
 
 
 def slugify(name: str) -> str:
@@ -286,7 +145,8 @@ def slugify(name: str) -> str:
 
     ``"My Startup"`` → ``"my-startup"``, ``""`` → ``"default"``.
     """
-    slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+    dashed = name.lower().encode("ascii", "replace").translate(_SLUG_TABLE)
+    slug = "-".join(filter(None, dashed.decode("ascii").split("-")))
     return slug or "default"
 
 
@@ -334,13 +194,49 @@ def get_company_dir(
 def list_companies(base: Path | None = None) -> list[str]:
     """Return slugs of all companies (subdirs containing ``config.yaml``)."""
     root = get_root_dir(base)
-    if not root.is_dir():
+    try:
+        # DirEntry.is_dir() answers from the directory listing itself, so
+        # each candidate costs a single stat (of its config.yaml).
+        with os.scandir(root) as entries:
+            return sorted(
+                e.name
+                for e in entries
+                if e.is_dir() and os.path.isfile(os.path.join(e.path, "config.yaml"))
+            )
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return sorted(
-        d.name
-        for d in root.iterdir()
-        if d.is_dir() and (d / "config.yaml").exists()
-    )
+
+
+def load_all_company_configs(
+    base: Path | None = None,
+) -> dict[str, CompanyConfig | None]:
+    """Load every company's config in one pass over the root directory.
+
+    Returns a mapping of slug to config, sorted by slug like
+    :func:`list_companies`; a config that fails to load or validate maps
+    to ``None``.  Loads go through :func:`load_config`'s per-file cache.
+    """
+    root = get_root_dir(base)
+    try:
+        entries = sorted(os.scandir(root), key=lambda e: e.name)
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+    configs: dict[str, CompanyConfig | None] = {}
+    for entry in entries:
+        if not entry.is_dir():
+            continue
+        config_path = Path(entry.path) / "config.yaml"
+        try:
+            configs[entry.name] = load_config(config_path)
+        except FileNotFoundError:
+            continue
+        except Exception:
+            configs[entry.name] = None
+    return configs
+
+
+# Root directories already checked by maybe_migrate_legacy_layout().
+_migration_checked: set[Path] = set()
 
 
 def maybe_migrate_legacy_layout(base: Path | None = None) -> bool:
@@ -351,6 +247,10 @@ def maybe_migrate_legacy_layout(base: Path | None = None) -> bool:
     Idempotent — returns *True* if a migration actually happened.
     """
     root = get_root_dir(base)
+    # Only the first call per root touches the filesystem.
+    if root in _migration_checked:
+        return False
+    _migration_checked.add(root)
     legacy_config = root / "config.yaml"
     if not legacy_config.exists():
         return False
@@ -363,28 +263,179 @@ def maybe_migrate_legacy_layout(base: Path | None = None) -> bool:
     for pattern in ("config.yaml", "company.db", "company.db-wal", "company.db-shm"):
         src = root / pattern
         if src.exists():
-            shutil.move(str(src), str(default_dir / pattern))
+            # Both paths are under root (one filesystem): a single rename(2).
+            os.replace(src, default_dir / pattern)
     return True
 
 
+@functools.lru_cache(maxsize=1)
+def _yaml_codecs() -> tuple[type, type]:
+    """Import PyYAML on first use; return its fastest safe (loader, dumper).
+
+    These are the libyaml-backed classes when PyYAML was built with it,
+    else the pure-Python ones.
+    """
+    import yaml
+
+    return (
+        getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+        getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+    )
+
+# Validated configs keyed by resolved path -> ((st_mtime_ns, st_size), dump),
+# where dump is the config's model_dump(); kept in least- to most-recently-used
+# order and capped at _CONFIG_CACHE_SIZE.
+_config_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+_CONFIG_CACHE_SIZE = 64
+
+
 def load_config(path: Path) -> CompanyConfig:
     """Load and validate a company configuration from a YAML file.
 
     Environment variable placeholders (``${VAR}``) are expanded before
-    validation.
+    validation.  Parsed configs are cached per file (LRU, up to 64 files)
+    and reused until the file's mtime or size changes; each call returns
+    its own copy, so callers are free to mutate the result.
+    """
+    from agent_company_ai.config_models import CompanyConfig
+
+    st = os.stat(path)
+    key = str(Path(path).resolve())
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _config_cache.pop(key, None)
+    if cached is not None and cached[0] == stamp:
+        _config_cache[key] = cached
+        # Re-validating the cached dump in pydantic-core builds a fresh,
+        # independent model several times faster than model_copy(deep=True)
+        # or a Python-level model_construct() walk of the nested models.
+        return CompanyConfig.model_validate(cached[1])
+    config = _load_config_uncached(path)
+    if len(_config_cache) >= _CONFIG_CACHE_SIZE:
+        del _config_cache[next(iter(_config_cache))]
+    _config_cache[key] = (stamp, config.model_dump())
+    return config
+
+
+def _load_config_uncached(path: Path) -> CompanyConfig:
+    import yaml
+
+    from agent_company_ai.config_models import CompanyConfig
+
+    raw_bytes = path.read_bytes()
+    # Hand libyaml the bytes: a str would only be re-encoded to UTF-8.
+    raw_data = yaml.load(raw_bytes, Loader=_yaml_codecs()[0]) or {}
+    # Most configs hold no placeholder at all; one memchr-backed search of
+    # the raw file is enough to skip walking the parsed tree.
+    if b"${" in raw_bytes:
+        _expand_env_in_place(raw_data)
+    return CompanyConfig.model_validate(raw_data)
+
+
+def load_config_preview(path: Path) -> tuple[str, int]:
+    """Return ``(name, agent_count)`` from a config file without validating it.
+
+    Streams YAML parse events from the open file and stops as soon as both
+    top-level keys have been seen, so the rest of the file is never read and
+    no Python objects or Pydantic models are built.  Meant for cheap
+    summaries (e.g. the ``destroy`` confirmation banner).
     """
-    raw_text = path.read_text(encoding="utf-8")
-    raw_data = yaml.safe_load(raw_text) or {}
-    expanded = _expand_env_recursive(raw_data)
-    return CompanyConfig.model_validate(expanded)
+    import yaml
+
+    with open(path, "rb") as fh:
+        return _preview_from_events(yaml.parse(fh, Loader=_yaml_codecs()[0]))
+
+
+def _preview_from_events(events: Iterator[yaml.Event]) -> tuple[str, int]:
+    import yaml
+
+    name = "My AI Company"  # CompanyConfig.name's default
+    agent_count = 0
+    seen: set[str] = set()
+
+    def _skip(event: yaml.Event) -> None:
+        # Consume the rest of a collection whose start event was *event*.
+        if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+            depth = 1
+            while depth:
+                ev = next(events)
+                if isinstance(ev, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                    depth += 1
+                elif isinstance(ev, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                    depth -= 1
+
+    for event in events:
+        if isinstance(event, yaml.MappingStartEvent):
+            break
+    else:
+        return name, agent_count
+
+    for key_event in events:
+        if not isinstance(key_event, yaml.ScalarEvent):
+            break  # end of the top-level mapping (or a complex key)
+        value = next(events)
+        if key_event.value == "name" and isinstance(value, yaml.ScalarEvent):
+            name = _expand_env_vars(value.value)
+            seen.add("name")
+        elif key_event.value == "agents" and isinstance(value, yaml.SequenceStartEvent):
+            for item in events:
+                if isinstance(item, yaml.SequenceEndEvent):
+                    break
+                agent_count += 1
+                _skip(item)
+            seen.add("agents")
+        else:
+            _skip(value)
+        if len(seen) == 2:
+            break
+    return name, agent_count
 
 
 def save_config(config: CompanyConfig, path: Path) -> None:
-    """Serialize a :class:`CompanyConfig` to a YAML file."""
+    """Serialize a :class:`CompanyConfig` to a YAML file.
+
+    The document is rendered in memory first, written with a single
+    ``write`` to a temp file and renamed over *path*, so a crash mid-save
+    never leaves a truncated config behind.
+    """
+    import yaml
+
     path.parent.mkdir(parents=True, exist_ok=True)
     data = config.model_dump(mode="python", exclude_none=True)
-    with open(path, "w", encoding="utf-8") as fh:
-        yaml.dump(data, fh, default_flow_style=False, sort_keys=False)
+    text = yaml.dump(
+        data, Dumper=_yaml_codecs()[1], default_flow_style=False, sort_keys=False
+    )
+    raw_bytes = text.encode("utf-8")
+    _write_atomic(path, raw_bytes)
+    # On filesystems with coarse timestamps a quick same-size rewrite can keep
+    # the old (mtime, size) stamp, so don't rely on it to invalidate.
+    _config_cache.pop(str(path.resolve()), None)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Replace *path* with *data* so readers never see a partial file.
+
+    Writes a sibling temp file in one call and renames it over the target,
+    keeping the target's permission bits (config files may hold API keys).
+    When replacing a file the temp file starts owner-only, so it is never
+    more readable than the target; a new file gets the usual umask default.
+    """
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        fd = os.open(
+            tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666 if mode is None else 0o600
+        )
+        with open(fd, "wb") as fh:
+            fh.write(data)
+        if mode is not None:
+            os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def load_role(role_name: str) -> dict:
@@ -405,30 +456,59 @@ def load_role(role_name: str) -> dict:
     FileNotFoundError
         If no matching role YAML exists in the package ``roles/`` directory.
     """
-    role_path = _ROLES_DIR / f"{role_name}.yaml"
-    if not role_path.exists():
+    if role_name not in _packaged_yaml_names(_ROLES_DIR):
         raise FileNotFoundError(
             f"No preset role named '{role_name}'. "
             f"Available roles: {list_available_roles()}"
         )
-    with open(role_path, encoding="utf-8") as fh:
-        return yaml.safe_load(fh)
+    return _copy_packaged_yaml(_ROLES_DIR, role_name)
 
 
 def list_available_roles() -> list[str]:
     """Return the names of all preset roles shipped with the package."""
-    if not _ROLES_DIR.is_dir():
-        return []
-    return sorted(
-        p.stem for p in _ROLES_DIR.glob("*.yaml") if p.is_file()
-    )
+    return list(_packaged_yaml_names(_ROLES_DIR))
+
+
+# Role and ProfitEngine files ship inside the package and do not change
+# while the process runs, so each directory is listed once (and name checks
+# are lookups in that listing, not stat calls) and each file parsed once.
+
+def _package_dir(directory: str) -> Traversable:
+    from importlib.resources import files
+
+    return files("agent_company_ai").joinpath(directory)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_packaged_yaml(directory: str, stem: str) -> object:
+    import yaml
+
+    raw_bytes = _package_dir(directory).joinpath(f"{stem}.yaml").read_bytes()
+    return yaml.load(raw_bytes, Loader=_yaml_codecs()[0])
+
+
+def _copy_packaged_yaml(directory: str, stem: str) -> dict:
+    """Return a private copy of a packaged YAML file's parsed contents."""
+    import copy
+
+    return copy.deepcopy(_parse_packaged_yaml(directory, stem))
+
+
+@functools.lru_cache(maxsize=None)
+def _packaged_yaml_names(directory: str) -> tuple[str, ...]:
+    package_dir = _package_dir(directory)
+    if not package_dir.is_dir():
+        return ()
+    return tuple(sorted(
+        e.name[:-5] for e in package_dir.iterdir() if e.name.endswith(".yaml") and e.is_file()
+    ))
 
 
 # ---------------------------------------------------------------------------
 # ProfitEngine template helpers
 # ---------------------------------------------------------------------------
 
-_PROFIT_ENGINE_TEMPLATES_DIR = Path(__file__).resolve().parent / "profit_engine_templates"
+_PROFIT_ENGINE_TEMPLATES_DIR = "profit_engine_templates"
 
 
 def load_profit_engine_template(name: str) -> dict:
@@ -449,20 +529,14 @@ def load_profit_engine_template(name: str) -> dict:
     FileNotFoundError
         If no matching template YAML exists.
     """
-    template_path = _PROFIT_ENGINE_TEMPLATES_DIR / f"{name}.yaml"
-    if not template_path.exists():
+    if name not in _packaged_yaml_names(_PROFIT_ENGINE_TEMPLATES_DIR):
         raise FileNotFoundError(
             f"No ProfitEngine template named '{name}'. "
             f"Available: {list_profit_engine_templates()}"
         )
-    with open(template_path, encoding="utf-8") as fh:
-        return yaml.safe_load(fh)
+    return _copy_packaged_yaml(_PROFIT_ENGINE_TEMPLATES_DIR, name)
 
 
 def list_profit_engine_templates() -> list[str]:
     """Return the names of all ProfitEngine preset templates."""
-    if not _PROFIT_ENGINE_TEMPLATES_DIR.is_dir():
-        return []
-    return sorted(
-        p.stem for p in _PROFIT_ENGINE_TEMPLATES_DIR.glob("*.yaml") if p.is_file()
-    )
+    return list(_packaged_yaml_names(_PROFIT_ENGINE_TEMPLATES_DIR))
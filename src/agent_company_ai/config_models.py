@@ -0,0 +1,238 @@
+"""Pydantic models for the company configuration file.
+
+Kept apart from :mod:`agent_company_ai.config` because building the model
+classes is the slowest part of importing it; the path and YAML helpers
+there load these lazily and re-export them under their usual names.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class LLMProviderConfig(BaseModel):
+    """Configuration for a single LLM provider (Anthropic, OpenAI, etc.)."""
+
+    api_key: str = ""
+    model: str = ""
+    base_url: Optional[str] = None  # For OpenAI-compatible endpoints
+    max_tokens: int = 4096
+
+
+class LLMConfig(BaseModel):
+    """Top-level LLM configuration that can hold multiple providers."""
+
+    default_provider: str = "anthropic"
+    anthropic: Optional[LLMProviderConfig] = None
+    openai: Optional[LLMProviderConfig] = None
+    # Replay text-only replies to identical requests for this many seconds.
+    # Off by default: replies are sampled, so a hit repeats one sample.
+    response_cache_ttl_seconds: int = 0
+
+
+class AgentConfig(BaseModel):
+    """Configuration for a single agent in the company."""
+
+    name: str
+    role: str
+    provider: Optional[str] = None  # Override LLMConfig.default_provider
+    model: Optional[str] = None  # Override the provider's default model
+
+
+class DashboardConfig(BaseModel):
+    """Web dashboard settings."""
+
+    port: int = 8420
+    host: str = "127.0.0.1"
+
+
+class AutonomousConfig(BaseModel):
+    """Limits and budgets for autonomous (goal-driven) mode."""
+
+    max_cycles: int = 5             # CEO review-and-replan cycles
+    max_waves_per_cycle: int = 10   # delegation waves within one cycle
+    max_agent_iterations: int = 25  # tool-call loops per agent per task
+    max_total_tasks: int = 50       # hard cap on total tasks created
+    max_time_seconds: int = 3600    # 1 hour wall-clock timeout (0 = unlimited)
+    max_cost_usd: float = 10.0     # per-run spending cap in USD (0 = unlimited)
+    daily_budget_usd: float = 20.0  # rolling 24-hour budget in USD (0 = unlimited)
+
+
+class WalletConfig(BaseModel):
+    """Blockchain wallet settings."""
+
+    enabled: bool = False
+    default_chain: str = "ethereum"
+
+
+# (label, field) pairs rendered by ProfitEngineConfig.format_dna, in order.
+_DNA_FIELDS = (
+    ("Mission", "mission"),
+    ("Revenue Streams", "revenue_streams"),
+    ("Target Customers", "target_customers"),
+    ("Pricing Model", "pricing_model"),
+    ("Competitive Edge", "competitive_edge"),
+    ("Key Metrics", "key_metrics"),
+    ("Cost Priorities", "cost_priorities"),
+    ("Additional Context", "additional_context"),
+)
+
+
+class ProfitEngineConfig(BaseModel):
+    """Business DNA — defines how the company earns money and survives.
+
+    When ``enabled`` is *True* and at least one field is non-empty, the
+    formatted DNA string is injected into every agent's system prompt and
+    into the CEO's autonomous goal loop.
+    """
+
+    enabled: bool = False
+    mission: str = ""
+    revenue_streams: str = ""
+    target_customers: str = ""
+    pricing_model: str = ""
+    competitive_edge: str = ""
+    key_metrics: str = ""
+    cost_priorities: str = ""
+    additional_context: str = ""
+
+    def format_dna(self) -> str:
+        """Format the business DNA into a prompt-ready string.
+
+        Returns an empty string if the engine is disabled or every field is
+        blank, so callers can simply check truthiness.
+        """
+        if not self.enabled:
+            return ""
+
+        sections = [
+            f"- **{label}:** {value}"
+            for label, field in _DNA_FIELDS
+            if (value := getattr(self, field).strip())
+        ]
+        if not sections:
+            return ""
+
+        return (
+            "\n\n--- COMPANY BUSINESS DNA (ProfitEngine) ---\n"
+            "The following defines how this company earns money and what matters most. "
+            "Factor this into every decision, recommendation, and deliverable.\n\n"
+            + "\n".join(sections)
+            + "\n--- END BUSINESS DNA ---"
+        )
+
+
+class RateLimitConfig(BaseModel):
+    """Rate limits for external service integrations."""
+
+    emails_per_hour: int = 20
+    emails_per_day: int = 100
+    payment_links_per_day: int = 10
+    max_payment_amount_usd: float = 500.0
+    tweets_per_day: int = 17          # Free tier is very restrictive
+    deploys_per_day: int = 50
+    gumroad_daily: int = 50
+    invoices_daily: int = 50
+    bookings_daily: int = 20
+    prospects_per_hour: int = 30
+    prospects_per_day: int = 200
+    browse_per_hour: int = 60
+    browse_per_day: int = 500
+
+
+class EmailConfig(BaseModel):
+    """Email sending configuration (Resend or SendGrid)."""
+
+    enabled: bool = False
+    provider: str = "resend"          # "resend" or "sendgrid"
+    api_key: str = ""                 # ${RESEND_API_KEY} or ${SENDGRID_API_KEY}
+    from_address: str = ""
+    from_name: str = ""
+    reply_to: str = ""
+
+
+class StripeConfig(BaseModel):
+    """Stripe payment integration configuration."""
+
+    enabled: bool = False
+    api_key: str = ""                 # ${STRIPE_SECRET_KEY}
+
+
+class LandingPageConfig(BaseModel):
+    """Landing page generator configuration."""
+
+    enabled: bool = False
+    serve_port: int = 8421
+    output_dir: str = "landing_pages"
+
+
+class TwitterConfig(BaseModel):
+    """Twitter/X API configuration for publishing social posts."""
+
+    enabled: bool = False
+    api_key: str = ""              # ${TWITTER_API_KEY}
+    api_secret: str = ""           # ${TWITTER_API_SECRET}
+    access_token: str = ""         # ${TWITTER_ACCESS_TOKEN}
+    access_token_secret: str = ""  # ${TWITTER_ACCESS_TOKEN_SECRET}
+
+
+class VercelConfig(BaseModel):
+    """Vercel deployment configuration for landing pages."""
+
+    enabled: bool = False
+    token: str = ""                # ${VERCEL_TOKEN}
+    project_name: str = ""         # optional: sets subdomain prefix
+
+
+class GumroadConfig(BaseModel):
+    """Gumroad digital product sales configuration."""
+
+    enabled: bool = False
+    access_token: str = ""           # ${GUMROAD_ACCESS_TOKEN}
+
+
+class InvoiceConfig(BaseModel):
+    """Invoice generator configuration."""
+
+    enabled: bool = False
+    company_name: str = ""
+    company_address: str = ""
+    payment_instructions: str = ""
+    currency: str = "USD"
+
+
+class CalcomConfig(BaseModel):
+    """Cal.com paid booking configuration."""
+
+    enabled: bool = False
+    api_key: str = ""                # ${CALCOM_API_KEY}
+    default_duration: int = 30
+
+
+class IntegrationsConfig(BaseModel):
+    """External service integrations."""
+
+    email: EmailConfig = Field(default_factory=EmailConfig)
+    stripe: StripeConfig = Field(default_factory=StripeConfig)
+    landing_page: LandingPageConfig = Field(default_factory=LandingPageConfig)
+    twitter: TwitterConfig = Field(default_factory=TwitterConfig)
+    vercel: VercelConfig = Field(default_factory=VercelConfig)
+    gumroad: GumroadConfig = Field(default_factory=GumroadConfig)
+    invoice: InvoiceConfig = Field(default_factory=InvoiceConfig)
+    calcom: CalcomConfig = Field(default_factory=CalcomConfig)
+    rate_limits: RateLimitConfig = Field(default_factory=RateLimitConfig)
+
+
+class CompanyConfig(BaseModel):
+    """Root configuration object representing the entire company."""
+
+    name: str = "My AI Company"
+    llm: LLMConfig = Field(default_factory=LLMConfig)
+    agents: list[AgentConfig] = Field(default_factory=list)
+    dashboard: DashboardConfig = Field(default_factory=DashboardConfig)
+    autonomous: AutonomousConfig = Field(default_factory=AutonomousConfig)
+    wallet: WalletConfig = Field(default_factory=WalletConfig)
+    profit_engine: ProfitEngineConfig = Field(default_factory=ProfitEngineConfig)
+    integrations: IntegrationsConfig = Field(default_factory=IntegrationsConfig)
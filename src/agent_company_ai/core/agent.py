@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import uuid
@@ -11,7 +12,7 @@ from agent_company_ai.core.role import Role
 from agent_company_ai.core.task import Task
 from agent_company_ai.core.message_bus import MessageBus
 from agent_company_ai.core.cost_tracker import CostTracker
-from agent_company_ai.llm.base import LLMMessage, BaseLLMProvider, ToolDefinition
+from agent_company_ai.llm.base import LLMMessage, LLMResponse, BaseLLMProvider, ToolCall, ToolDefinition
 from agent_company_ai.tools.registry import ToolRegistry
 from agent_company_ai.tools.file_io import copy_to_output
 from agent_company_ai.tools.wallet_tools import set_current_agent
@@ -30,10 +31,15 @@ from agent_company_ai.tools.content_tool import set_content_agent
 from agent_company_ai.tools.browser_tool import set_browser_agent
 
 if TYPE_CHECKING:
+    from agent_company_ai.core.response_cache import ResponseCache
     from agent_company_ai.storage.database import Database
 
 logger = logging.getLogger("agent_company_ai.agent")
 
+# Chat history budget, estimated at about four characters per token.
+_MAX_HISTORY_TOKENS = 32_000
+_CHARS_PER_TOKEN = 4
+
 
 class Agent:
     """A single AI agent with a role, tools, and LLM backend."""
@@ -49,6 +55,7 @@ class Agent:
         team_members: list[str] | None = None,
         cost_tracker: CostTracker | None = None,
         profit_engine_dna: str = "",
+        response_cache: ResponseCache | None = None,
     ):
         self.name = name
         self.role = role
@@ -57,20 +64,34 @@ class Agent:
         self.db = db
         self.company_name = company_name
         self._cost_tracker = cost_tracker
+        self._response_cache = response_cache
         self._conversation: list[LLMMessage] = []
+        self._max_history_tokens = _MAX_HISTORY_TOKENS
         self._system_prompt = role.build_system_prompt(
             company_name=company_name,
             team_members=team_members or [],
             profit_engine_dna=profit_engine_dna,
         )
         self._tool_registry = ToolRegistry.get()
+        # (registry version, definitions) from the last build.
+        self._tool_defs: tuple[int, list[ToolDefinition]] | None = None
 
         # Register on message bus
         self._inbox = message_bus.register_agent(name)
 
     @property
     def tool_definitions(self) -> list[ToolDefinition]:
-        """Get LLM-formatted tool definitions for this agent's allowed tools."""
+        """Get LLM-formatted tool definitions for this agent's allowed tools.
+
+        Shared by every LLM call the agent makes until a tool is registered;
+        callers must not mutate the list.
+        """
+        version = self._tool_registry.version
+        if self._tool_defs is None or self._tool_defs[0] != version:
+            self._tool_defs = (version, self._build_tool_definitions())
+        return self._tool_defs[1]
+
+    def _build_tool_definitions(self) -> list[ToolDefinition]:
         tools = self._tool_registry.get_tools(self.role.default_tools)
         # Add delegation tool if agent can delegate
         defs = [t.to_definition() for t in tools]
@@ -185,15 +206,18 @@ class Agent:
         self._result_rejections = 0
 
         for iteration in range(max_iterations):
+            # Leading reentrant tool calls start while the model is still
+            # streaming the rest of its reply.
+            started: list[tuple[ToolCall, asyncio.Task[str]]] = []
             try:
-                response = await self.provider.complete(
-                    messages=messages,
-                    tools=self.tool_definitions,
+                response = await self._stream_turn(
+                    messages, task, started, best_assistant_text,
                 )
             except Exception as e:
                 logger.error(f"[{self.name}] LLM error: {e}")
                 task.fail(str(e))
                 return f"Error: {e}"
+            early = await self._adopt_started(started, response.tool_calls)
 
             # Track cost
             self._track_usage(response.usage)
@@ -221,20 +245,23 @@ class Agent:
                 ],
             ))
 
-            for tc in response.tool_calls:
-                tool_result = await self._execute_tool(
-                    tc.name, tc.arguments, task, best_assistant_text,
-                )
+            for batch in self._tool_call_batches(response.tool_calls):
+                tool_results = await asyncio.gather(*(
+                    early.pop(tc.id, None)
+                    or self._execute_tool(tc.name, tc.arguments, task, best_assistant_text)
+                    for tc in batch
+                ))
 
                 # Check if task is now terminal (report_result was called)
                 if task.is_terminal:
                     return task.result or "Task completed."
 
-                messages.append(LLMMessage(
-                    role="tool",
-                    content=tool_result,
-                    tool_call_id=tc.id,
-                ))
+                for tc, tool_result in zip(batch, tool_results):
+                    messages.append(LLMMessage(
+                        role="tool",
+                        content=tool_result,
+                        tool_call_id=tc.id,
+                    ))
 
         # Ran out of iterations — try to salvage by using the best content
         # from the conversation. Scan tool results for web_search data and
@@ -252,6 +279,116 @@ class Agent:
         task.fail("Exceeded maximum iterations without completing.")
         return "Failed: exceeded maximum iterations."
 
+    async def _stream_turn(
+        self,
+        messages: list[LLMMessage],
+        task: Task,
+        started: list[tuple[ToolCall, asyncio.Task[str]]],
+        assistant_text: str,
+    ) -> LLMResponse:
+        """Get the next response, starting its first tool batch early.
+
+        Tool calls that will make up the first batch (see
+        :meth:`_tool_call_batches`) are scheduled as soon as the provider
+        has streamed them and appended to *started*.  Later calls wait for
+        the full response so they still run in order.
+        """
+        cache_key = None
+        if self._response_cache is not None:
+            cache_key = self._response_cache.key(self.provider, messages, self.tool_definitions)
+            cached = await self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        response: LLMResponse | None = None
+        leading = True
+        try:
+            async for event in self.provider.stream_complete(
+                messages=messages,
+                tools=self.tool_definitions,
+            ):
+                if isinstance(event, LLMResponse):
+                    response = event
+                    continue
+                tool = self._tool_registry.get_tool(event.name)
+                leading = leading and tool is not None and tool.reentrant
+                if leading:
+                    started.append((event, asyncio.create_task(
+                        self._execute_tool(event.name, event.arguments, task, assistant_text)
+                    )))
+        except BaseException:
+            # Early runs must not outlive a failed stream.
+            await self._cancel_runs([run for _, run in started])
+            started.clear()
+            raise
+        if response is None:
+            raise RuntimeError("LLM stream ended without a response")
+        if cache_key is not None:
+            await self._response_cache.put(cache_key, response)
+        return response
+
+    async def _adopt_started(
+        self,
+        started: list[tuple[ToolCall, asyncio.Task[str]]],
+        tool_calls: list[ToolCall] | None,
+    ) -> dict[str, asyncio.Task[str]]:
+        """Match early-started tool runs to the response's first batch.
+
+        Returns the matched runs keyed by the response's call ids.  A run
+        matches by call id, or else by identical name and arguments, so a
+        provider that renumbers calls in its final response does not make a
+        tool run twice.  Runs that match nothing are cancelled and awaited
+        rather than left behind.
+        """
+        adopted: dict[str, asyncio.Task[str]] = {}
+        if started and tool_calls:
+            first_batch = self._tool_call_batches(tool_calls)[0]
+            for tc in first_batch:
+                for i, (early, run) in enumerate(started):
+                    if early.id == tc.id:
+                        break
+                else:
+                    for i, (early, run) in enumerate(started):
+                        if early.name == tc.name and early.arguments == tc.arguments:
+                            break
+                    else:
+                        continue
+                adopted[tc.id] = run
+                del started[i]
+        await self._cancel_runs([run for _, run in started])
+        started.clear()
+        return adopted
+
+    @staticmethod
+    async def _cancel_runs(runs: list[asyncio.Task[str]]) -> None:
+        """Cancel *runs* and wait for them, retrieving any exceptions."""
+        for run in runs:
+            run.cancel()
+        if runs:
+            await asyncio.gather(*runs, return_exceptions=True)
+
+    def _tool_call_batches(self, tool_calls: list) -> list[list]:
+        """Split one turn's tool calls into batches that may run concurrently.
+
+        Consecutive calls to reentrant registry tools share a batch.  Calls to
+        report_result, delegate_task, unknown tools and non-reentrant tools
+        each get a batch of their own, so they run alone and in order.
+        """
+        batches: list[list] = []
+        run: list = []
+        for tc in tool_calls:
+            tool = self._tool_registry.get_tool(tc.name)
+            if tool is not None and tool.reentrant:
+                run.append(tc)
+                continue
+            if run:
+                batches.append(run)
+                run = []
+            batches.append([tc])
+        if run:
+            batches.append(run)
+        return batches
+
     async def _execute_tool(
         self, tool_name: str, arguments: dict, task: Task, assistant_text: str = "",
     ) -> str:
@@ -415,18 +552,49 @@ class Agent:
         self._conversation.append(LLMMessage(role="user", content=message))
 
         try:
-            response = await self.provider.complete(
+            cache_key = cached = None
+            if self._response_cache is not None:
+                cache_key = self._response_cache.key(
+                    self.provider, self._conversation, self.tool_definitions,
+                )
+                cached = await self._response_cache.get(cache_key)
+            response = cached or await self.provider.complete(
                 messages=self._conversation,
                 tools=self.tool_definitions,
             )
+            if cache_key is not None and cached is None:
+                await self._response_cache.put(cache_key, response)
         except Exception as e:
             return f"Error: {e}"
 
         self._track_usage(response.usage)
         reply = response.content or "(no response)"
         self._conversation.append(LLMMessage(role="assistant", content=reply))
+        self._trim_conversation()
         return reply
 
+    def _trim_conversation(self) -> None:
+        """Drop the oldest chat exchanges once the history outgrows its budget.
+
+        The system prompt stays first and byte-identical and kept messages
+        are never rewritten, so the provider's prompt cache still matches
+        the prefix.  Whole exchanges are removed, oldest first, down to half
+        the budget so trims (which move the cached prefix) stay rare.  The
+        newest exchange is always kept.
+        """
+        conversation = self._conversation
+        budget = self._max_history_tokens * _CHARS_PER_TOKEN
+        total = sum(len(m.content) for m in conversation)
+        if total <= budget:
+            return
+        excess = total - budget // 2
+        last = max(i for i, m in enumerate(conversation) if m.role == "user")
+        cut = 1
+        while cut < last and (excess > 0 or conversation[cut].role != "user"):
+            excess -= len(conversation[cut].content)
+            cut += 1
+        del conversation[1:cut]
+
     async def process_inbox(self) -> list[str]:
         """Process any pending messages in the agent's inbox."""
         results = []
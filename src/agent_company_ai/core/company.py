@@ -7,8 +7,9 @@ import json
 import logging
 import time
 import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Callable, Awaitable
+from typing import AsyncIterator, Callable, Awaitable
 
 from agent_company_ai.config import (
     CompanyConfig,
@@ -21,6 +22,7 @@ from agent_company_ai.config import (
 from agent_company_ai.core.agent import Agent
 from agent_company_ai.core.cost_tracker import CostTracker
 from agent_company_ai.core.message_bus import MessageBus, BusMessage
+from agent_company_ai.core.response_cache import ResponseCache
 from agent_company_ai.core.role import load_role
 from agent_company_ai.core.task import Task, TaskBoard, TaskStatus
 from agent_company_ai.llm.router import LLMRouter
@@ -81,6 +83,8 @@ class Company:
         self.task_board = TaskBoard()
         self.router = LLMRouter(config.llm)
         self.cost_tracker = CostTracker()
+        ttl = config.llm.response_cache_ttl_seconds
+        self.response_cache = ResponseCache(db, ttl) if ttl > 0 else None
         self.agents: dict[str, Agent] = {}
         self._running = False
         self._stop_requested = False
@@ -235,24 +239,56 @@ class Company:
                 f"No company found at {company_dir}. Run 'agent-company-ai init' first."
             )
 
-        config = load_config(config_path)
+        # Parse the config on a worker thread while the database opens.
         db = get_database(company_dir)
-        await db.connect()
+        config, connected = await asyncio.gather(
+            asyncio.to_thread(load_config, config_path),
+            db.connect(),
+            return_exceptions=True,
+        )
+        for result in (config, connected):
+            if isinstance(result, BaseException):
+                await db.close()
+                raise result
 
-        company = cls(config=config, company_dir=company_dir, db=db)
+        try:
+            company = cls(config=config, company_dir=company_dir, db=db)
+
+            async def _restore(agent_cfg) -> None:
+                try:
+                    await company._add_agent_from_config(agent_cfg)
+                except Exception as e:
+                    logger.warning(f"Failed to restore agent {agent_cfg.name}: {e}")
+
+            # Restore agents from config and register the wallet in the DB (if
+            # one exists) together; each step only waits on its own DB writes.
+            # Agents are added to ``company.agents`` before their first await,
+            # so the roster keeps config order.
+            startup = [_restore(agent_cfg) for agent_cfg in config.agents]
+            if company.wallet_manager and company.wallet_manager.has_wallet():
+                startup.append(company.wallet_manager.register_wallet_in_db())
+            await asyncio.gather(*startup)
+        except BaseException:
+            # An open connection's worker thread would keep the process alive.
+            await db.close()
+            raise
 
-        # Restore agents from config
-        for agent_cfg in config.agents:
-            try:
-                await company._add_agent_from_config(agent_cfg)
-            except Exception as e:
-                logger.warning(f"Failed to restore agent {agent_cfg.name}: {e}")
+        return company
 
-        # Register wallet in DB if it exists
-        if company.wallet_manager and company.wallet_manager.has_wallet():
-            await company.wallet_manager.register_wallet_in_db()
+    @classmethod
+    @asynccontextmanager
+    async def session(
+        cls, base_path: Path | None = None, company: str = "default"
+    ) -> AsyncIterator[Company]:
+        """Load a company for the duration of an ``async with`` block.
 
-        return company
+        The company is shut down when the block exits, including on error.
+        """
+        instance = await cls.load(base_path, company=company)
+        try:
+            yield instance
+        finally:
+            await instance.shutdown()
 
     @classmethod
     async def init(cls, base_path: Path | None = None, name: str = "My AI Company", company: str = "default") -> Company:
@@ -266,8 +302,11 @@ class Company:
 
         db = get_database(company_dir)
         await db.connect()
-
-        return cls(config=config, company_dir=company_dir, db=db)
+        try:
+            return cls(config=config, company_dir=company_dir, db=db)
+        except BaseException:
+            await db.close()
+            raise
 
     def set_event_handler(self, handler: Callable[[str, dict], Awaitable[None]]) -> None:
         """Set a callback for company events (used by dashboard)."""
@@ -375,6 +414,7 @@ class Company:
             team_members=team_members,
             cost_tracker=self.cost_tracker,
             profit_engine_dna=profit_engine_dna,
+            response_cache=self.response_cache,
         )
         self.agents[cfg.name] = agent
 
@@ -0,0 +1,80 @@
+"""Exact-match cache for text-only LLM replies."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from dataclasses import asdict
+from typing import TYPE_CHECKING
+
+from agent_company_ai.llm.base import LLMMessage, LLMResponse, ToolDefinition
+
+if TYPE_CHECKING:
+    from agent_company_ai.llm.base import BaseLLMProvider
+    from agent_company_ai.storage.database import Database
+
+# Stop reasons meaning the reply hit the token limit (Anthropic, OpenAI).
+_TRUNCATED = frozenset({"max_tokens", "length"})
+
+
+class ResponseCache:
+    """Replays stored LLM replies for byte-identical requests.
+
+    Only complete responses without tool calls are stored: replaying text
+    is harmless, but a replayed tool call would repeat its side effects,
+    and a reply cut off at ``max_tokens`` is not worth repeating.  A hit
+    costs one indexed SQLite lookup and no tokens.  Entries live in the
+    company database and expire after *ttl_seconds*.
+    """
+
+    def __init__(self, db: Database, ttl_seconds: int):
+        self.db = db
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def key(
+        provider: BaseLLMProvider,
+        messages: list[LLMMessage],
+        tools: list[ToolDefinition] | None,
+    ) -> str:
+        """Hash everything that determines the reply into a cache key."""
+        payload = json.dumps(
+            [
+                provider.base_url,
+                provider.model,
+                provider.max_tokens,
+                [asdict(m) for m in messages],
+                [asdict(t) for t in tools or ()],
+            ],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=32).hexdigest()
+
+    async def get(self, key: str) -> LLMResponse | None:
+        """Return the unexpired reply stored under *key*, if any."""
+        row = await self.db.fetch_one(
+            "SELECT content, stop_reason FROM llm_response_cache "
+            "WHERE key = ? AND created_at >= ?",
+            (key, time.time() - self.ttl_seconds),
+        )
+        if row is None:
+            return None
+        # No usage: a cached reply spends no tokens.
+        return LLMResponse(content=row["content"], stop_reason=row["stop_reason"])
+
+    async def put(self, key: str, response: LLMResponse) -> None:
+        """Store *response* under *key* unless it asks for tool calls or was truncated."""
+        if response.tool_calls or response.stop_reason in _TRUNCATED:
+            return
+        now = time.time()
+        await self.db.execute(
+            "DELETE FROM llm_response_cache WHERE created_at < ?",
+            (now - self.ttl_seconds,),
+        )
+        await self.db.execute(
+            "INSERT OR REPLACE INTO llm_response_cache "
+            "(key, content, stop_reason, created_at) VALUES (?, ?, ?, ?)",
+            (key, response.content, response.stop_reason, now),
+        )
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
-from pathlib import Path
+from importlib.resources import files
 
 import yaml
 
 
-ROLES_DIR = Path(__file__).parent.parent / "roles"
+ROLES_DIR = files("agent_company_ai") / "roles"
+
+# libyaml-backed loader when PyYAML was built with it.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 @dataclass
@@ -40,27 +44,36 @@ class Role:
 
 def load_role(role_name: str) -> Role:
     """Load a role from the preset YAML files."""
-    role_file = ROLES_DIR / f"{role_name}.yaml"
-    if not role_file.exists():
-        raise ValueError(f"Unknown role: {role_name}. Available: {list_available_roles()}")
-
-    with open(role_file) as f:
-        data = yaml.safe_load(f)
-
+    data = _role_data(role_name)
     return Role(
         name=data["name"],
         title=data["title"],
         description=data["description"],
         system_prompt=data["system_prompt"],
-        default_tools=data.get("default_tools", []),
-        can_delegate_to=data.get("can_delegate_to", []),
+        default_tools=list(data.get("default_tools", [])),
+        can_delegate_to=list(data.get("can_delegate_to", [])),
         reports_to=data.get("reports_to", "owner"),
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _role_data(role_name: str) -> dict:
+    """Parse a preset role file once; every agent with the role reuses it."""
+    if role_name not in _role_names():
+        raise ValueError(f"Unknown role: {role_name}. Available: {list_available_roles()}")
+
+    raw_bytes = (ROLES_DIR / f"{role_name}.yaml").read_bytes()
+    return yaml.load(raw_bytes, Loader=_YamlLoader)
+
+
 def list_available_roles() -> list[str]:
     """List all available preset role names."""
-    return [f.stem for f in ROLES_DIR.glob("*.yaml")]
+    return list(_role_names())
+
+
+@functools.lru_cache(maxsize=1)
+def _role_names() -> tuple[str, ...]:
+    return tuple(f.name[:-5] for f in ROLES_DIR.iterdir() if f.name.endswith(".yaml"))
 
 
 def create_custom_role(
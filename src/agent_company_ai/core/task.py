@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -31,6 +32,7 @@ class Task:
     artifacts: list[dict] = field(default_factory=list)
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    _done: asyncio.Event | None = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def create(
@@ -62,11 +64,13 @@ class Task:
         self.status = TaskStatus.DONE
         self.result = result
         self.updated_at = datetime.now(timezone.utc)
+        self._notify_done()
 
     def fail(self, reason: str | None = None) -> None:
         self.status = TaskStatus.FAILED
         self.result = reason
         self.updated_at = datetime.now(timezone.utc)
+        self._notify_done()
 
     def add_subtask(self, description: str, assignee: str | None = None) -> Task:
         subtask = Task.create(
@@ -81,11 +85,35 @@ class Task:
         self.status = TaskStatus.CANCELLED
         self.result = reason
         self.updated_at = datetime.now(timezone.utc)
+        self._notify_done()
+
+    def _notify_done(self) -> None:
+        if self._done is not None:
+            self._done.set()
+
+    async def wait_done(self, timeout: float | None = None) -> None:
+        """Wait until the task reaches a terminal status.
+
+        Raises ``asyncio.TimeoutError`` if *timeout* seconds pass first.
+        """
+        if self.is_terminal:
+            return
+        if self._done is None:
+            self._done = asyncio.Event()
+        await asyncio.wait_for(self._done.wait(), timeout)
 
     @property
     def is_terminal(self) -> bool:
         return self.status in (TaskStatus.DONE, TaskStatus.FAILED, TaskStatus.CANCELLED)
 
+    @property
+    def subtask_count(self) -> int:
+        return len(self.subtasks)
+
+    @property
+    def subtasks_done(self) -> int:
+        return sum(1 for st in self.subtasks if st.is_terminal)
+
     @property
     def all_subtasks_done(self) -> bool:
         return all(st.is_terminal for st in self.subtasks) if self.subtasks else True
@@ -100,8 +128,8 @@ class Task:
             "parent_id": self.parent_id,
             "result": self.result,
             "artifacts": self.artifacts,
-            "subtask_count": len(self.subtasks),
-            "subtasks_done": sum(1 for st in self.subtasks if st.is_terminal),
+            "subtask_count": self.subtask_count,
+            "subtasks_done": self.subtasks_done,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
@@ -291,7 +291,7 @@ async def api_profit_engine_templates():
 async def api_wallet_balance(chain: str | None = Query(None)):
     if not _company:
         return {"error": "Company not loaded"}
-    return _company.wallet_manager.get_balance(chain_name=chain)
+    return await _company.wallet_manager.get_balance_async(chain_name=chain)
 
 
 @_app.get("/api/wallet/address")
@@ -13,10 +13,14 @@ from agent_company_ai.llm.base import (
     LLMResponse,
     ToolCall,
     ToolDefinition,
+    shared_client,
 )
 
 logger = logging.getLogger(__name__)
 
+# Marks the end of a request prefix for Anthropic prompt caching.
+_EPHEMERAL = {"type": "ephemeral"}
+
 
 class AnthropicProvider(BaseLLMProvider):
     """LLM provider backed by the Anthropic Messages API.
@@ -34,13 +38,30 @@ class AnthropicProvider(BaseLLMProvider):
     ):
         super().__init__(api_key=api_key, model=model, base_url=base_url, max_tokens=max_tokens)
 
-        try:
-            import anthropic
-        except ImportError as exc:
+        import importlib.util
+
+        # Only check that the SDK is installed here; importing it is the
+        # slowest part of start-up, so the client is built on first use.
+        if importlib.util.find_spec("anthropic") is None:
             raise ImportError(
                 "The 'anthropic' package is required for the Anthropic provider. "
                 "Install it with: pip install anthropic"
-            ) from exc
+            )
+
+    @property
+    def _client(self):
+        """The ``anthropic.AsyncAnthropic`` client for the running event loop.
+
+        Providers with the same key and endpoint (e.g. agents that only
+        override the model) share one client per loop, so their concurrent
+        requests reuse one connection pool instead of each opening its own.
+        """
+        return shared_client(("anthropic", self.api_key, self.base_url), self._build_client)
+
+    def _build_client(self):
+        import importlib.util
+
+        import anthropic
 
         client_kwargs: dict = {
             "api_key": self.api_key,
@@ -48,8 +69,14 @@ class AnthropicProvider(BaseLLMProvider):
         }
         if self.base_url:
             client_kwargs["base_url"] = self.base_url
+        # Multiplex requests over one connection when h2 is installed.
+        if importlib.util.find_spec("h2") is not None:
+            client_kwargs["http_client"] = anthropic.DefaultAsyncHttpxClient(http2=True)
+        return anthropic.AsyncAnthropic(**client_kwargs)
 
-        self._client = anthropic.AsyncAnthropic(**client_kwargs)
+    def warmup(self) -> None:
+        """Import the SDK ahead of the first request, without sending one."""
+        import anthropic  # noqa: F401
 
     # ------------------------------------------------------------------
     # Format conversion helpers
@@ -160,9 +187,16 @@ class AnthropicProvider(BaseLLMProvider):
 
         usage = None
         if response.usage:
+            # With prompt caching, input_tokens only counts the uncached tail.
+            # Report the full prompt size so cost estimates and budgets never
+            # undercount; the cache split is kept alongside.
+            cache_write = getattr(response.usage, "cache_creation_input_tokens", None) or 0
+            cache_read = getattr(response.usage, "cache_read_input_tokens", None) or 0
             usage = {
-                "input_tokens": response.usage.input_tokens,
+                "input_tokens": response.usage.input_tokens + cache_write + cache_read,
                 "output_tokens": response.usage.output_tokens,
+                "cache_creation_input_tokens": cache_write,
+                "cache_read_input_tokens": cache_read,
             }
 
         return LLMResponse(
@@ -196,14 +230,24 @@ class AnthropicProvider(BaseLLMProvider):
 
         return False
 
-    async def complete(
+    def _request_kwargs(
         self,
         messages: list[LLMMessage],
-        tools: list[ToolDefinition] | None = None,
-    ) -> LLMResponse:
-        """Send a completion request to the Anthropic Messages API."""
+        tools: list[ToolDefinition] | None,
+    ) -> dict:
+        """Build ``messages.create`` arguments with prompt-cache breakpoints.
+
+        Anthropic caches the request prefix up to each ``cache_control``
+        marker; the prefix order is tools, system, messages.  One marker on
+        the system prompt covers the tool schemas and the system prompt.  A
+        second marker goes on the newest message: agent loops only append
+        to the conversation, so the next call re-reads everything up to it
+        from the cache and is billed only for what was added since.
+        """
         system_text, non_system_messages = self._extract_system(messages)
         anthropic_messages = self._convert_messages(non_system_messages)
+        if anthropic_messages:
+            self._mark_cache_breakpoint(anthropic_messages[-1])
 
         kwargs: dict = {
             "model": self.model,
@@ -211,9 +255,32 @@ class AnthropicProvider(BaseLLMProvider):
             "messages": anthropic_messages,
         }
         if system_text:
-            kwargs["system"] = system_text
+            kwargs["system"] = [
+                {"type": "text", "text": system_text, "cache_control": _EPHEMERAL},
+            ]
         if tools:
             kwargs["tools"] = self._convert_tools(tools)
+        return kwargs
+
+    @staticmethod
+    def _mark_cache_breakpoint(message: dict) -> None:
+        """Put a cache marker on the last content block of *message*."""
+        content = message["content"]
+        if isinstance(content, str):
+            if content:
+                message["content"] = [
+                    {"type": "text", "text": content, "cache_control": _EPHEMERAL},
+                ]
+        elif content:
+            content[-1] = {**content[-1], "cache_control": _EPHEMERAL}
+
+    async def complete(
+        self,
+        messages: list[LLMMessage],
+        tools: list[ToolDefinition] | None = None,
+    ) -> LLMResponse:
+        """Send a completion request to the Anthropic Messages API."""
+        kwargs = self._request_kwargs(messages, tools)
 
         last_exc: Exception | None = None
         for attempt in range(3):
@@ -236,24 +303,55 @@ class AnthropicProvider(BaseLLMProvider):
         logger.error("Anthropic API call failed after 3 attempts: %s", last_exc)
         raise last_exc  # type: ignore[misc]
 
+    async def stream_complete(
+        self,
+        messages: list[LLMMessage],
+        tools: list[ToolDefinition] | None = None,
+    ) -> AsyncIterator[ToolCall | LLMResponse]:
+        """Stream a completion, yielding each tool_use block as it closes.
+
+        Retries like :meth:`complete`, but only until the first tool call
+        has been yielded; after that the caller may already be running it.
+        """
+        kwargs = self._request_kwargs(messages, tools)
+
+        for attempt in range(3):
+            yielded = False
+            try:
+                async with self._client.messages.stream(**kwargs) as stream:
+                    async for event in stream:
+                        if event.type != "content_block_stop":
+                            continue
+                        block = event.content_block
+                        if block.type == "tool_use":
+                            yielded = True
+                            yield ToolCall(
+                                id=block.id,
+                                name=block.name,
+                                arguments=block.input if isinstance(block.input, dict) else {},
+                            )
+                    message = await stream.get_final_message()
+            except Exception as exc:
+                if yielded or attempt == 2 or not self._is_retryable(exc):
+                    logger.error("Anthropic streaming call failed: %s", exc)
+                    raise
+                delay = 2 ** (attempt * 2)
+                logger.warning(
+                    "Anthropic API call failed (attempt %d/3), retrying in %ds: %s",
+                    attempt + 1, delay, exc,
+                )
+                await asyncio.sleep(delay)
+                continue
+            yield self._parse_response(message)
+            return
+
     async def stream(
         self,
         messages: list[LLMMessage],
         tools: list[ToolDefinition] | None = None,
     ) -> AsyncIterator[str]:
         """Stream text deltas from the Anthropic Messages API."""
-        system_text, non_system_messages = self._extract_system(messages)
-        anthropic_messages = self._convert_messages(non_system_messages)
-
-        kwargs: dict = {
-            "model": self.model,
-            "max_tokens": self.max_tokens,
-            "messages": anthropic_messages,
-        }
-        if system_text:
-            kwargs["system"] = system_text
-        if tools:
-            kwargs["tools"] = self._convert_tools(tools)
+        kwargs = self._request_kwargs(messages, tools)
 
         try:
             async with self._client.messages.stream(**kwargs) as stream:
@@ -2,9 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, Callable, Hashable
+
+# SDK clients shared by providers that talk to the same endpoint, kept per
+# event loop: an httpx connection pool only works on the loop that opened
+# it.  Values hold a weak reference to their loop to detect id() reuse.
+_shared_clients: dict[tuple[int, Hashable], tuple[weakref.ref, Any]] = {}
+
+
+def shared_client(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """Return the running loop's client for *key*, building it if needed.
+
+    Outside an event loop (e.g. a warm-up in a worker thread) a fresh,
+    unshared client is returned.  Entries for closed or collected loops are
+    dropped whenever a new client is stored.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return factory()
+
+    entry = _shared_clients.get((id(loop), key))
+    if entry is not None and entry[0]() is loop:
+        return entry[1]
+
+    for stale_key, (loop_ref, _) in list(_shared_clients.items()):
+        stale_loop = loop_ref()
+        if stale_loop is None or stale_loop.is_closed():
+            del _shared_clients[stale_key]
+    client = factory()
+    _shared_clients[(id(loop), key)] = (weakref.ref(loop), client)
+    return client
 
 
 @dataclass
@@ -132,6 +164,13 @@ class BaseLLMProvider(ABC):
         self.base_url = base_url
         self.max_tokens = max_tokens
 
+    def warmup(self) -> None:
+        """Do any slow, local set-up ahead of the first request.
+
+        Must not send anything over the network.  The default does nothing;
+        providers that import an SDK or build a client lazily override it.
+        """
+
     @abstractmethod
     async def complete(
         self,
@@ -175,3 +214,33 @@ class BaseLLMProvider(ABC):
             Incremental text chunks produced by the model.
         """
         ...
+
+    async def stream_complete(
+        self,
+        messages: list[LLMMessage],
+        tools: list[ToolDefinition] | None = None,
+    ) -> AsyncIterator[ToolCall | LLMResponse]:
+        """Stream a completion, yielding each tool call once it is complete.
+
+        Every tool call is yielded as soon as its arguments have been fully
+        received, so callers can start running it while the model is still
+        generating.  The final item is always the complete ``LLMResponse``,
+        which repeats the same tool calls in order.  The default
+        implementation calls :meth:`complete` and yields its result.
+
+        Parameters
+        ----------
+        messages:
+            The conversation history.
+        tools:
+            Optional list of tools the model is allowed to invoke.
+
+        Yields
+        ------
+        ToolCall | LLMResponse
+            Finished tool calls, followed by the full response.
+        """
+        response = await self.complete(messages, tools)
+        for tool_call in response.tool_calls or ():
+            yield tool_call
+        yield response
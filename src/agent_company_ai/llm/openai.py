@@ -13,6 +13,7 @@ from agent_company_ai.llm.base import (
     LLMResponse,
     ToolCall,
     ToolDefinition,
+    shared_client,
 )
 
 logger = logging.getLogger(__name__)
@@ -35,13 +36,30 @@ class OpenAIProvider(BaseLLMProvider):
     ):
         super().__init__(api_key=api_key, model=model, base_url=base_url, max_tokens=max_tokens)
 
-        try:
-            import openai
-        except ImportError as exc:
+        import importlib.util
+
+        # Only check that the SDK is installed here; importing it is the
+        # slowest part of start-up, so the client is built on first use.
+        if importlib.util.find_spec("openai") is None:
             raise ImportError(
                 "The 'openai' package is required for the OpenAI provider. "
                 "Install it with: pip install openai"
-            ) from exc
+            )
+
+    @property
+    def _client(self):
+        """The ``openai.AsyncOpenAI`` client for the running event loop.
+
+        Providers with the same key and endpoint (e.g. agents that only
+        override the model) share one client per loop, so their concurrent
+        requests reuse one connection pool instead of each opening its own.
+        """
+        return shared_client(("openai", self.api_key, self.base_url), self._build_client)
+
+    def _build_client(self):
+        import importlib.util
+
+        import openai
 
         client_kwargs: dict = {
             "api_key": self.api_key,
@@ -49,8 +67,14 @@ class OpenAIProvider(BaseLLMProvider):
         }
         if self.base_url:
             client_kwargs["base_url"] = self.base_url
-
-        self._client = openai.AsyncOpenAI(**client_kwargs)
+        # Multiplex requests over one connection when h2 is installed.
+        if importlib.util.find_spec("h2") is not None:
+            client_kwargs["http_client"] = openai.DefaultAsyncHttpxClient(http2=True)
+        return openai.AsyncOpenAI(**client_kwargs)
+
+    def warmup(self) -> None:
+        """Import the SDK ahead of the first request, without sending one."""
+        import openai  # noqa: F401
 
     # ------------------------------------------------------------------
     # Format conversion helpers
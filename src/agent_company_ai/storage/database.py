@@ -37,8 +37,18 @@ class Database:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn = await aiosqlite.connect(str(self.db_path))
 
-        # Enable WAL mode for better concurrent read performance.
-        await self._conn.execute("PRAGMA journal_mode=WAL;")
+        # Enable WAL mode for better concurrent read performance.  The mode
+        # is persistent in the database file, so only switch it once.
+        cursor = await self._conn.execute("PRAGMA journal_mode;")
+        row = await cursor.fetchone()
+        if row is None or str(row[0]).lower() != "wal":
+            await self._conn.execute("PRAGMA journal_mode=WAL;")
+
+        # Read pages through a memory map (up to 256 MiB), keep a 64 MiB page
+        # cache, and build temporary b-trees (GROUP BY / ORDER BY) in memory.
+        await self._conn.execute("PRAGMA mmap_size=268435456;")
+        await self._conn.execute("PRAGMA cache_size=-64000;")
+        await self._conn.execute("PRAGMA temp_store=MEMORY;")
 
         # Return rows as ``sqlite3.Row`` so we can convert to dicts easily.
         self._conn.row_factory = sqlite3.Row
@@ -330,6 +340,10 @@ class Database:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             );
 
+            -- Covers the status/date-window revenue summaries.
+            CREATE INDEX IF NOT EXISTS idx_revenue_status_created
+                ON revenue(status, created_at, amount_cents, source);
+
             CREATE TABLE IF NOT EXISTS prospect_searches (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 query TEXT NOT NULL,
@@ -365,6 +379,13 @@ class Database:
                 browsed_by TEXT DEFAULT '',
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             );
+
+            CREATE TABLE IF NOT EXISTS llm_response_cache (
+                key TEXT PRIMARY KEY,
+                content TEXT NOT NULL,
+                stop_reason TEXT,
+                created_at REAL NOT NULL
+            );
             """
         )
         await self._conn.commit()
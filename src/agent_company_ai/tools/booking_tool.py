@@ -191,6 +191,7 @@ async def create_booking_link(
         },
         "required": [],
     },
+    reentrant=True,
 )
 async def list_bookings(status: str = "", limit: int = 10) -> str:
     err = _require_configured()
@@ -245,6 +246,7 @@ async def list_bookings(status: str = "", limit: int = 10) -> str:
         "properties": {},
         "required": [],
     },
+    reentrant=True,
 )
 async def check_booking_revenue() -> str:
     err = _require_configured()
@@ -129,6 +129,7 @@ async def add_contact(
         },
         "required": [],
     },
+    reentrant=True,
 )
 async def list_contacts(
     status: str = "",
@@ -64,6 +64,7 @@ def _resolve(filepath: str) -> Path:
         },
         "required": ["path"],
     },
+    reentrant=True,
 )
 def read_file(path: str) -> str:
     target = _resolve(path)
@@ -121,6 +122,7 @@ def write_file(path: str, content: str) -> str:
         },
         "required": [],
     },
+    reentrant=True,
 )
 def list_files(path: str = ".") -> str:
     target = _resolve(path)
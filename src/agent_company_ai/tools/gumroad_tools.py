@@ -170,6 +170,7 @@ async def create_gumroad_product(
         },
         "required": [],
     },
+    reentrant=True,
 )
 async def list_gumroad_products(limit: int = 10) -> str:
     err = _require_configured()
@@ -224,6 +225,7 @@ async def list_gumroad_products(limit: int = 10) -> str:
         },
         "required": [],
     },
+    reentrant=True,
 )
 async def check_gumroad_sales(product_id: str = "", limit: int = 10) -> str:
     err = _require_configured()
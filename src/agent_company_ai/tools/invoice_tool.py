@@ -470,6 +470,7 @@ async def send_invoice(invoice_id: int) -> str:
         },
         "required": [],
     },
+    reentrant=True,
 )
 async def list_invoices(status: str = "", limit: int = 25) -> str:
     err = _require_configured()
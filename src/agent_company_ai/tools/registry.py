@@ -17,6 +17,9 @@ class Tool:
     parameters: dict[str, Any]
     func: Callable[..., Any] | Callable[..., Awaitable[Any]]
     is_async: bool = False
+    # True only for pure reads, which agents may run concurrently with other
+    # reentrant calls from the same turn; everything else runs alone, in order.
+    reentrant: bool = False
 
     def to_definition(self) -> ToolDefinition:
         return ToolDefinition(
@@ -43,6 +46,8 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools = {}
+        # Bumped on every registration, so callers can cache derived data.
+        self.version = 0
 
     @classmethod
     def get(cls) -> ToolRegistry:
@@ -52,6 +57,7 @@ class ToolRegistry:
 
     def register(self, tool: Tool) -> None:
         self._tools[tool.name] = tool
+        self.version += 1
 
     def get_tool(self, name: str) -> Tool | None:
         return self._tools.get(name)
@@ -103,11 +109,20 @@ def _extract_parameters(func: Callable) -> dict:
     return schema
 
 
-def tool(name: str, description: str, parameters: dict[str, Any] | None = None):
+def tool(
+    name: str,
+    description: str,
+    parameters: dict[str, Any] | None = None,
+    *,
+    reentrant: bool = False,
+):
     """Decorator to register a function as a tool.
 
+    Pass ``reentrant=True`` only for side-effect-free tools (reads, lookups);
+    those may run alongside other reentrant calls from the same LLM turn.
+
     Usage:
-        @tool("web_search", "Search the web for information")
+        @tool("web_search", "Search the web for information", reentrant=True)
         def web_search(query: str) -> str:
             ...
     """
@@ -120,6 +135,7 @@ def tool(name: str, description: str, parameters: dict[str, Any] | None = None):
             parameters=params,
             func=func,
             is_async=inspect.iscoroutinefunction(func),
+            reentrant=reentrant,
         )
         ToolRegistry.get().register(t)
         return func
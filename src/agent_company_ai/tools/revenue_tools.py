@@ -60,6 +60,7 @@ def _require_db() -> Database | None:
             },
         },
     },
+    reentrant=True,
 )
 async def check_revenue(days: int = 30) -> str:
     db = _require_db()
@@ -245,6 +245,7 @@ async def draft_social_post(
         },
         "required": [],
     },
+    reentrant=True,
 )
 async def list_social_drafts(
     platform: str = "",
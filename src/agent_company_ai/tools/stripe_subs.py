@@ -217,6 +217,7 @@ async def create_subscription_link(
         },
         "required": [],
     },
+    reentrant=True,
 )
 async def list_subscribers(limit: int = 10) -> str:
     err = _require_configured()
@@ -276,6 +277,7 @@ async def list_subscribers(limit: int = 10) -> str:
         "properties": {},
         "required": [],
     },
+    reentrant=True,
 )
 async def check_subscription_revenue() -> str:
     err = _require_configured()
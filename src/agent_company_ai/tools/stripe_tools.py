@@ -209,6 +209,7 @@ async def create_payment_link(
         },
         "required": [],
     },
+    reentrant=True,
 )
 async def check_payments(limit: int = 10) -> str:
     _require_configured()
@@ -73,6 +73,7 @@ def _require_wallet() -> WalletManager:
         },
         "required": [],
     },
+    reentrant=True,
 )
 def check_balance(chain: str = "") -> str:
     mgr = _require_wallet()
@@ -102,6 +103,7 @@ def check_balance(chain: str = "") -> str:
         "properties": {},
         "required": [],
     },
+    reentrant=True,
 )
 def get_wallet_address() -> str:
     mgr = _require_wallet()
@@ -177,6 +179,7 @@ async def request_payment(
         },
         "required": [],
     },
+    reentrant=True,
 )
 async def list_payments(status: str = "") -> str:
     mgr = _require_wallet()
@@ -37,6 +37,7 @@ def _strip_tags(html: str) -> str:
         },
         "required": ["query"],
     },
+    reentrant=True,
 )
 async def web_search(query: str) -> str:
     import httpx
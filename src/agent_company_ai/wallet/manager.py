@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 
 from agent_company_ai.storage.database import Database
@@ -15,6 +16,12 @@ from agent_company_ai.wallet.provider import Web3Provider
 
 logger = logging.getLogger("agent_company_ai.wallet.manager")
 
+# Columns of the payment_queue table, the only names list_payments selects.
+_PAYMENT_COLUMNS = frozenset({
+    "id", "to_address", "amount", "token", "chain", "reason", "requested_by",
+    "status", "tx_hash", "created_at", "executed_at",
+})
+
 
 class WalletManager:
     """Orchestrates keystore, Web3 provider, and database for wallet operations."""
@@ -70,6 +77,13 @@ class WalletManager:
 
         return self.provider.get_all_native_balances(addr)
 
+    async def get_balance_async(self, chain_name: str | None = None) -> dict:
+        """Async :meth:`get_balance`; all chains are queried concurrently."""
+        addr = self.address
+        if chain_name is None and addr is not None:
+            return await self.provider.get_all_native_balances_async(addr)
+        return await asyncio.to_thread(self.get_balance, chain_name)
+
     # ------------------------------------------------------------------
     # Payment queue
     # ------------------------------------------------------------------
@@ -111,16 +125,43 @@ class WalletManager:
         )
         return record
 
-    async def list_payments(self, status: str | None = None) -> list[dict]:
-        """List payments, optionally filtered by status."""
+    async def list_payments(
+        self,
+        status: str | None = None,
+        limit: int | None = None,
+        *,
+        since: date | None = None,
+        columns: tuple[str, ...] | None = None,
+    ) -> list[dict]:
+        """List payments, newest first, optionally filtered by status.
+
+        *limit* caps the number of rows returned by the query itself and
+        *since* (a date, or a naive UTC datetime) drops older payments.
+        *columns* selects a subset of ``payment_queue`` columns (all by
+        default); unknown names raise ``ValueError``.
+        """
+        if columns:
+            unknown = set(columns) - _PAYMENT_COLUMNS
+            if unknown:
+                raise ValueError(f"Unknown payment columns: {', '.join(sorted(unknown))}")
+        sql = f"SELECT {', '.join(columns) if columns else '*'} FROM payment_queue"
+        conditions: list[str] = []
+        params: tuple = ()
         if status:
-            return await self.db.fetch_all(
-                "SELECT * FROM payment_queue WHERE status = ? ORDER BY created_at DESC",
-                (status,),
-            )
-        return await self.db.fetch_all(
-            "SELECT * FROM payment_queue ORDER BY created_at DESC"
-        )
+            conditions.append("status = ?")
+            params += (status,)
+        if since is not None:
+            # created_at is stored as text ("YYYY-MM-DD HH:MM:SS"), which
+            # str() of a date or naive datetime compares against correctly.
+            conditions.append("created_at >= ?")
+            params += (str(since),)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY created_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
+        return await self.db.fetch_all(sql, params)
 
     async def get_payment(self, payment_id: str) -> dict | None:
         """Fetch a single payment by ID."""
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 from decimal import Decimal
 
@@ -28,30 +30,30 @@ def _require_web3() -> None:
         )
 
 
-class Web3Provider:
-    """Manages Web3 connections across multiple EVM chains."""
+@functools.lru_cache(maxsize=None)
+def _web3_for(chain_name: str) -> "Web3":
+    """Build the Web3 client for *chain_name* once per process.
 
-    def __init__(self) -> None:
-        self._instances: dict[str, "Web3"] = {}
-
-    def get_web3(self, chain_name: str) -> "Web3":
-        """Return a (cached) Web3 instance for the given chain.
+    Shared by every :class:`Web3Provider`, so reloading a company (the
+    dashboard, the CLI shell) keeps the warm HTTP connection pools.
+    Injects POA middleware for non-mainnet chains.
+    """
+    chain = get_chain(chain_name)
+    w3 = Web3(Web3.HTTPProvider(chain.rpc_url))
 
-        Injects POA middleware for non-mainnet chains.
-        """
-        _require_web3()
-        if chain_name in self._instances:
-            return self._instances[chain_name]
+    # Inject POA middleware for non-mainnet chains (Base, Arbitrum, Polygon)
+    if chain.chain_id != 1:
+        w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+    return w3
 
-        chain = get_chain(chain_name)
-        w3 = Web3(Web3.HTTPProvider(chain.rpc_url))
 
-        # Inject POA middleware for non-mainnet chains (Base, Arbitrum, Polygon)
-        if chain.chain_id != 1:
-            w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+class Web3Provider:
+    """Manages Web3 connections across multiple EVM chains."""
 
-        self._instances[chain_name] = w3
-        return w3
+    def get_web3(self, chain_name: str) -> "Web3":
+        """Return the (process-wide cached) Web3 instance for the given chain."""
+        _require_web3()
+        return _web3_for(chain_name)
 
     def get_native_balance(self, address: str, chain_name: str) -> Decimal:
         """Get the native token balance in human-readable units (e.g. ETH)."""
@@ -66,23 +68,39 @@ class Web3Provider:
         Returns a dict mapping chain name to {balance, symbol, error}.
         Errors on individual chains don't abort the whole operation.
         """
-        results = {}
-        for chain_name, chain in CHAINS.items():
-            try:
-                balance = self.get_native_balance(address, chain_name)
-                results[chain_name] = {
-                    "balance": str(balance),
-                    "symbol": chain.native_symbol,
-                    "error": None,
-                }
-            except Exception as e:
-                logger.warning(f"Failed to get balance on {chain_name}: {e}")
-                results[chain_name] = {
-                    "balance": "0",
-                    "symbol": chain.native_symbol,
-                    "error": str(e),
-                }
-        return results
+        return {
+            chain_name: self._native_balance_entry(address, chain_name)
+            for chain_name in CHAINS
+        }
+
+    async def get_all_native_balances_async(self, address: str) -> dict[str, dict]:
+        """Like :meth:`get_all_native_balances`, querying every chain at once.
+
+        Each blocking RPC call runs in the default executor, so the total
+        wait is the slowest chain rather than the sum of all of them.
+        """
+        entries = await asyncio.gather(*(
+            asyncio.to_thread(self._native_balance_entry, address, chain_name)
+            for chain_name in CHAINS
+        ))
+        return dict(zip(CHAINS, entries))
+
+    def _native_balance_entry(self, address: str, chain_name: str) -> dict:
+        chain = CHAINS[chain_name]
+        try:
+            balance = self.get_native_balance(address, chain_name)
+            return {
+                "balance": str(balance),
+                "symbol": chain.native_symbol,
+                "error": None,
+            }
+        except Exception as e:
+            logger.warning(f"Failed to get balance on {chain_name}: {e}")
+            return {
+                "balance": "0",
+                "symbol": chain.native_symbol,
+                "error": str(e),
+            }
 
     def send_transaction(
         self,
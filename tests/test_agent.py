@@ -0,0 +1,248 @@
+"""Tests for the Agent think loop and chat history."""
+
+from __future__ import annotations
+
+import asyncio
+
+from agent_company_ai.core.agent import Agent
+from agent_company_ai.core.message_bus import MessageBus
+from agent_company_ai.core.role import load_role
+from agent_company_ai.core.task import Task
+from agent_company_ai.llm.base import BaseLLMProvider, LLMMessage, LLMResponse, ToolCall
+from agent_company_ai.tools.registry import Tool, ToolRegistry, tool
+
+_events: list[tuple[str, str]] = []
+
+
+@tool("_test_agent_read", "A reentrant lookup", reentrant=True)
+async def _test_agent_read(key: str) -> str:
+    _events.append(("start", key))
+    await asyncio.sleep(0.05)
+    _events.append(("end", key))
+    return f"read {key}"
+
+
+@tool("_test_agent_write", "A tool with side effects")
+async def _test_agent_write(key: str) -> str:
+    _events.append(("start", key))
+    await asyncio.sleep(0.01)
+    _events.append(("end", key))
+    return f"wrote {key}"
+
+
+class _ScriptedProvider(BaseLLMProvider):
+    """Replays one canned response per call and records what it was sent."""
+
+    def __init__(self, responses: list[LLMResponse]):
+        super().__init__(api_key="test", model="test-model")
+        self.responses = responses
+        self.requests: list[list] = []
+
+    async def complete(self, messages, tools=None):
+        self.requests.append(list(messages))
+        return self.responses.pop(0)
+
+    async def stream(self, messages, tools=None):
+        yield ""
+
+
+class _StreamingProvider(_ScriptedProvider):
+    """Streams each response's tool calls, pausing before the final response."""
+
+    def __init__(self, responses, streamed_calls):
+        super().__init__(responses)
+        self.streamed_calls = streamed_calls
+
+    async def stream_complete(self, messages, tools=None):
+        self.requests.append(list(messages))
+        for tool_call in self.streamed_calls.pop(0):
+            yield tool_call
+        await asyncio.sleep(0.01)
+        _events.append(("stream", "end"))
+        yield self.responses.pop(0)
+
+
+class _FailingStreamProvider(_ScriptedProvider):
+    """Streams one tool call, then fails before the response is complete."""
+
+    async def stream_complete(self, messages, tools=None):
+        yield _call("r1", "_test_agent_read")
+        await asyncio.sleep(0.01)
+        raise ConnectionError("stream reset")
+
+
+class _NullDatabase:
+    async def execute(self, sql, params=()):
+        return None
+
+
+def _agent(provider: BaseLLMProvider) -> Agent:
+    return Agent("tester", load_role("developer"), provider, MessageBus(), _NullDatabase())
+
+
+def _call(call_id: str, name: str) -> ToolCall:
+    return ToolCall(id=call_id, name=name, arguments={"key": call_id})
+
+
+class TestToolDefinitions:
+    """Test the per-agent tool definition cache."""
+
+    def test_reused_until_a_tool_is_registered(self):
+        agent = _agent(_ScriptedProvider([]))
+        agent._tool_registry = ToolRegistry()
+        first = agent.tool_definitions
+        assert agent.tool_definitions is first
+
+        name = agent.role.default_tools[0]
+        assert name not in [d.name for d in first]
+        agent._tool_registry.register(
+            Tool(name=name, description="late", parameters={}, func=lambda: "")
+        )
+        assert name in [d.name for d in agent.tool_definitions]
+
+
+class TestToolBatching:
+    """Test how one turn's tool calls are scheduled."""
+
+    def test_serial_tools_run_alone_and_results_keep_order(self):
+        _events.clear()
+        calls = [
+            _call("r1", "_test_agent_read"),
+            _call("r2", "_test_agent_read"),
+            _call("w1", "_test_agent_write"),
+            _call("w2", "_test_agent_write"),
+            _call("r3", "_test_agent_read"),
+        ]
+        provider = _ScriptedProvider([
+            LLMResponse(content="", tool_calls=calls),
+            LLMResponse(content="done"),
+        ])
+        assert asyncio.run(_agent(provider).think(Task.create(description="t"))) == "done"
+
+        # The two leading reads overlap; each write runs alone, in order.
+        assert _events[:2] == [("start", "r1"), ("start", "r2")]
+        assert _events[4:] == [
+            ("start", "w1"), ("end", "w1"),
+            ("start", "w2"), ("end", "w2"),
+            ("start", "r3"), ("end", "r3"),
+        ]
+        tool_messages = [m for m in provider.requests[1] if m.role == "tool"]
+        assert [m.tool_call_id for m in tool_messages] == ["r1", "r2", "w1", "w2", "r3"]
+        assert tool_messages[2].content == "wrote w1"
+
+
+class TestEarlyToolStart:
+    """Test that streamed tool calls start before the response finishes."""
+
+    def _run(self, streamed, final):
+        _events.clear()
+        provider = _StreamingProvider(
+            [LLMResponse(content="", tool_calls=final), LLMResponse(content="done")],
+            [streamed, []],
+        )
+        assert asyncio.run(_agent(provider).think(Task.create(description="t"))) == "done"
+        return provider
+
+    def test_each_tool_runs_once(self):
+        calls = [_call("r1", "_test_agent_read"), _call("r2", "_test_agent_read")]
+        provider = self._run(calls, calls)
+        assert [e for e in _events if e[0] == "start"] == [("start", "r1"), ("start", "r2")]
+        assert _events.index(("start", "r1")) < _events.index(("stream", "end"))
+        tool_messages = [m for m in provider.requests[1] if m.role == "tool"]
+        assert [m.content for m in tool_messages] == ["read r1", "read r2"]
+
+    def test_renumbered_calls_are_not_run_twice(self):
+        streamed = [_call("r1", "_test_agent_read")]
+        final = [ToolCall(id="other-id", name="_test_agent_read", arguments={"key": "r1"})]
+        provider = self._run(streamed, final)
+        assert _events.count(("start", "r1")) == 1
+        tool_messages = [m for m in provider.requests[1] if m.role == "tool"]
+        assert [(m.tool_call_id, m.content) for m in tool_messages] == [("other-id", "read r1")]
+
+    def test_unmatched_early_run_is_cancelled(self):
+        streamed = [_call("r1", "_test_agent_read"), _call("gone", "_test_agent_read")]
+        self._run(streamed, [_call("r1", "_test_agent_read")])
+        assert ("end", "gone") not in _events
+        assert _events.count(("end", "r1")) == 1
+
+    def test_failed_stream_cancels_and_awaits_early_runs(self):
+        _events.clear()
+
+        async def _think():
+            task = Task.create(description="t")
+            result = await _agent(_FailingStreamProvider([])).think(task)
+            leftover = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            return result, leftover
+
+        result, leftover = asyncio.run(_think())
+        assert result == "Error: stream reset"
+        assert leftover == []
+        assert _events == [("start", "r1")]
+
+    def test_serial_tools_wait_for_the_full_response(self):
+        calls = [_call("w1", "_test_agent_write")]
+        self._run(calls, calls)
+        assert _events.index(("stream", "end")) < _events.index(("start", "w1"))
+
+
+def _exchange(n: int) -> list[LLMMessage]:
+    """A user turn answered after one tool call, 400 characters in all."""
+    return [
+        LLMMessage(role="user", content=f"question {n}".ljust(100)),
+        LLMMessage(
+            role="assistant",
+            content="looking".ljust(100),
+            tool_calls=[{"id": f"c{n}", "name": "_test_agent_read", "arguments": {}}],
+        ),
+        LLMMessage(role="tool", content="result".ljust(100), tool_call_id=f"c{n}"),
+        LLMMessage(role="assistant", content=f"answer {n}".ljust(100)),
+    ]
+
+
+class TestTrimConversation:
+    """Test that chat history stays within its budget."""
+
+    def _agent_with_history(
+        self, exchanges: int, budget_tokens: int, responses: list[LLMResponse] = (),
+    ) -> Agent:
+        agent = _agent(_ScriptedProvider(list(responses)))
+        agent._max_history_tokens = budget_tokens
+        agent._conversation = [LLMMessage(role="system", content="system prompt")]
+        for n in range(exchanges):
+            agent._conversation.extend(_exchange(n))
+        return agent
+
+    def test_within_budget_untouched(self):
+        agent = self._agent_with_history(3, budget_tokens=1_000)
+        before = list(agent._conversation)
+        agent._trim_conversation()
+        assert agent._conversation == before
+
+    def test_keeps_system_and_newest_exchange_whole(self):
+        agent = self._agent_with_history(10, budget_tokens=500)
+        system = agent._conversation[0]
+        newest = agent._conversation[-4:]
+        agent._trim_conversation()
+
+        conversation = agent._conversation
+        assert conversation[0] is system
+        assert conversation[-4:] == newest
+        assert sum(len(m.content) for m in conversation) <= 500 * 4 // 2
+        # Trimmed at exchange boundaries: every tool call keeps its result.
+        assert conversation[1].role == "user"
+        call_ids = [tc["id"] for m in conversation if m.tool_calls for tc in m.tool_calls]
+        result_ids = [m.tool_call_id for m in conversation if m.role == "tool"]
+        assert call_ids == result_ids
+
+    def test_newest_exchange_kept_even_over_budget(self):
+        agent = self._agent_with_history(3, budget_tokens=10)
+        newest = agent._conversation[-4:]
+        agent._trim_conversation()
+        assert agent._conversation[1:] == newest
+
+    def test_chat_trims_after_reply(self):
+        agent = self._agent_with_history(
+            5, budget_tokens=200, responses=[LLMResponse(content="y" * 400)],
+        )
+        assert asyncio.run(agent.chat("x" * 100)) == "y" * 400
+        assert [m.role for m in agent._conversation] == ["system", "user", "assistant"]
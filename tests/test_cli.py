@@ -0,0 +1,319 @@
+"""Tests for CLI helpers."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from agent_company_ai.cli import app as cli
+
+
+def _make_tree(root: Path) -> None:
+    (root / "a" / "b" / "c").mkdir(parents=True)
+    (root / "top.txt").write_text("x", encoding="utf-8")
+    (root / "a" / "one.txt").write_text("x", encoding="utf-8")
+    (root / "a" / "b" / "c" / "deep.db").write_text("x", encoding="utf-8")
+    (root / "a" / "b" / "empty").mkdir()
+
+
+class TestCommandRegistration:
+    """Test that the commands available don't depend on the host's argv."""
+
+    def test_cli_runner_ignores_sys_argv(self):
+        # The host's argv is set before the CLI module is first imported.
+        script = (
+            "import sys\n"
+            "sys.argv = ['pytest', '-k', 'team']\n"
+            "from typer.testing import CliRunner\n"
+            "from agent_company_ai.cli.app import app\n"
+            "result = CliRunner().invoke(app, ['roles'])\n"
+            "print(result.output)\n"
+            "sys.exit(result.exit_code)\n"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, timeout=60,
+        )
+        assert proc.returncode == 0, proc.stdout + proc.stderr
+        assert "ceo" in proc.stdout
+
+    def test_app_runs_command_from_its_args(self, monkeypatch, capsys):
+        monkeypatch.setattr("sys.argv", ["host", "team"])
+        cli.app(["-C", "other", "roles"], standalone_mode=False)
+        assert "ceo" in capsys.readouterr().out
+
+    def test_unknown_command_sees_whole_app(self, monkeypatch):
+        monkeypatch.setattr("sys.argv", ["host"])
+        with pytest.raises(Exception, match="No such command 'nope'"):
+            cli.app(["nope"], standalone_mode=False)
+
+
+def _init_company(tmp_path, monkeypatch) -> CliRunner:
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.app, ["init", "-n", "Shell Co", "-p", "anthropic", "-k", "sk-test", "-m", "m"],
+    )
+    assert result.exit_code == 0, result.output
+    return runner
+
+
+class TestCleanup:
+    """Test that every entry point closes the shared loop and companies."""
+
+    def test_cli_runner_closes_runner(self, tmp_path, monkeypatch):
+        runner = _init_company(tmp_path, monkeypatch)
+        for args in (["hire", "developer", "--name", "Dev"], ["team"], ["fire", "Nobody"]):
+            runner.invoke(cli.app, args)
+            assert cli._runner is None
+            assert cli._company_cache == {}
+        workers = [
+            t for t in threading.enumerate()
+            if t is not threading.main_thread() and not t.daemon
+        ]
+        assert workers == []
+
+    def test_failed_init_save_still_shuts_down(self, tmp_path, monkeypatch):
+        import agent_company_ai.config as config
+
+        Company = cli._Company()
+        shut_down = []
+        real_shutdown = Company.shutdown
+
+        async def _slow_shutdown(self):
+            import asyncio
+
+            await asyncio.sleep(0.05)
+            await real_shutdown(self)
+            shut_down.append(True)
+
+        def _failing_save(*args):
+            raise OSError("disk full")
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(Company, "shutdown", _slow_shutdown)
+        monkeypatch.setattr(config, "save_config", _failing_save)
+        result = CliRunner().invoke(
+            cli.app, ["init", "-n", "Full Co", "-p", "anthropic", "-k", "sk-test", "-m", "m"],
+        )
+        assert isinstance(result.exception, OSError)
+        assert shut_down == [True]
+        assert cli._runner is None
+
+
+class TestShell:
+    """Test the shell command's dispatch, error recovery and exit."""
+
+    def test_commands_share_one_loaded_company(self, tmp_path, monkeypatch):
+        runner = _init_company(tmp_path, monkeypatch)
+        Company = cli._Company()
+        loads = []
+        real_load = Company.load.__func__
+
+        async def _counting_load(cls, *args, **kwargs):
+            loads.append(kwargs.get("company"))
+            return await real_load(cls, *args, **kwargs)
+
+        monkeypatch.setattr(Company, "load", classmethod(_counting_load))
+        result = runner.invoke(
+            cli.app, ["shell"], input="hire developer --name Dev\nteam\ntasks\nexit\n",
+        )
+        assert result.exit_code == 0, result.output
+        assert "Hired Dev" in result.output
+        assert "Dev" in result.output.split("Hired Dev", 1)[1]
+        assert loads == ["default"]
+
+    def test_errors_are_reported_and_session_continues(self, tmp_path, monkeypatch):
+        runner = _init_company(tmp_path, monkeypatch)
+        result = runner.invoke(
+            cli.app, ["shell"],
+            input="fire Nobody\nnope\nhire\nhire developer --name Dev\nteam\n",
+        )
+        assert result.exit_code == 0, result.output
+        assert "No agent named 'Nobody'" in result.output
+        assert "No such command 'nope'" in result.output
+        assert "Missing argument" in result.output
+        assert "Hired Dev" in result.output
+
+    def test_exit_closes_everything(self, tmp_path, monkeypatch):
+        runner = _init_company(tmp_path, monkeypatch)
+        for script in ("team\nexit\n", "team\n"):  # explicit exit, then Ctrl-D
+            result = runner.invoke(cli.app, ["shell"], input=script)
+            assert result.exit_code == 0, result.output
+            assert cli._in_shell is False
+            assert cli._runner is None
+            assert cli._company_cache == {}
+
+
+def _queue_payments(count: int) -> None:
+    """Queue *count* payments for the company in the current directory."""
+    import asyncio
+
+    from agent_company_ai.config import get_company_dir
+    from agent_company_ai.storage.database import get_database
+    from agent_company_ai.wallet.manager import WalletManager
+
+    async def _queue():
+        company_dir = get_company_dir(company="default", create=False)
+        manager = WalletManager(company_dir / "wallet", get_database(company_dir))
+        await manager.db.connect()
+        try:
+            for _ in range(count):
+                await manager.queue_payment("0x" + "ab" * 20, "1", "ethereum", reason="queued-by-test")
+        finally:
+            await manager.db.close()
+
+    asyncio.run(_queue())
+
+
+class TestWalletPayments:
+    """Test the payment queue listing."""
+
+    @pytest.fixture
+    def runner(self, tmp_path, monkeypatch):
+        from rich.console import Console
+
+        runner = _init_company(tmp_path, monkeypatch)
+        # Wide enough that no row is wrapped or elided.
+        monkeypatch.setattr(cli, "console", Console(highlight=False, width=300))
+        return runner
+
+    def test_lists_every_payment_by_default(self, runner):
+        _queue_payments(105)
+        result = runner.invoke(cli.app, ["wallet", "payments"])
+        assert result.exit_code == 0, result.output
+        assert result.output.count("queued-by-test") == 105
+        assert "--limit" not in result.output
+
+    def test_limit_shows_newest(self, runner):
+        _queue_payments(5)
+        result = runner.invoke(cli.app, ["wallet", "payments", "-n", "3"])
+        assert result.exit_code == 0, result.output
+        assert result.output.count("queued-by-test") == 3
+        assert "Showing the 3 newest" in result.output
+
+
+    def test_since_filters_by_date(self, runner):
+        import asyncio
+
+        from agent_company_ai.storage.database import Database
+
+        _queue_payments(3)
+
+        async def _backdate():
+            db = Database(Path(".agent-company-ai/default/company.db"))
+            await db.connect()
+            try:
+                await db.execute(
+                    "UPDATE payment_queue SET created_at = '2024-01-04 23:59:59' "
+                    "WHERE id IN (SELECT id FROM payment_queue LIMIT 2)"
+                )
+            finally:
+                await db.close()
+
+        asyncio.run(_backdate())
+        result = runner.invoke(cli.app, ["wallet", "payments", "--since", "2024-01-05"])
+        assert result.exit_code == 0, result.output
+        assert result.output.count("queued-by-test") == 1
+
+    @pytest.mark.parametrize("since", ["2024-1-5", "yesterday"])
+    def test_since_rejects_non_dates(self, runner, since):
+        result = runner.invoke(cli.app, ["wallet", "payments", "--since", since])
+        assert result.exit_code == 2
+        assert "is not a date" in result.output
+
+    def test_unknown_columns_rejected(self, tmp_path):
+        import asyncio
+
+        from agent_company_ai.storage.database import Database
+        from agent_company_ai.wallet.manager import WalletManager
+
+        manager = WalletManager(tmp_path / "wallet", Database(tmp_path / "company.db"))
+        with pytest.raises(ValueError, match="Unknown payment columns"):
+            asyncio.run(manager.list_payments(columns=("id", "1; DROP TABLE payment_queue")))
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX flock")
+class TestCompanyLock:
+    """Test the cross-process lock around check-then-create steps."""
+
+    def test_second_holder_waits_and_no_file_is_left(self, tmp_path):
+        import asyncio
+
+        order = []
+
+        async def _hold(tag, delay):
+            async with cli._lock_for(tmp_path):
+                order.append(f"{tag} in")
+                await asyncio.sleep(delay)
+                order.append(f"{tag} out")
+
+        async def _both():
+            first = asyncio.create_task(_hold("a", 0.05))
+            await asyncio.sleep(0.01)
+            await asyncio.gather(first, _hold("b", 0))
+
+        asyncio.run(_both())
+        assert order == ["a in", "a out", "b in", "b out"]
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestFastRmtree:
+    """Test the parallel company directory delete."""
+
+    def test_removes_nested_tree(self, tmp_path):
+        target = tmp_path / "company"
+        _make_tree(target)
+        cli._fast_rmtree(target)
+        assert not target.exists()
+
+    def test_reuses_a_prior_walk(self, tmp_path):
+        target = tmp_path / "company"
+        _make_tree(target)
+        walked = cli._walk_for_delete(target)
+        cli._fast_rmtree(target, walked)
+        assert not target.exists()
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX symlinks")
+    def test_symlinks_removed_not_followed(self, tmp_path):
+        outside = tmp_path / "outside"
+        (outside / "nested").mkdir(parents=True)
+        (outside / "keep.txt").write_text("x", encoding="utf-8")
+        target = tmp_path / "company"
+        _make_tree(target)
+        (target / "linked_dir").symlink_to(outside, target_is_directory=True)
+        (target / "a" / "linked_file").symlink_to(outside / "keep.txt")
+        cli._fast_rmtree(target)
+        assert not target.exists()
+        assert (outside / "keep.txt").read_text(encoding="utf-8") == "x"
+        assert (outside / "nested").is_dir()
+
+    def test_read_only_files(self, tmp_path):
+        target = tmp_path / "company"
+        _make_tree(target)
+        (target / "top.txt").chmod(0o400)
+        (target / "a" / "b" / "c" / "deep.db").chmod(0o400)
+        cli._fast_rmtree(target)
+        assert not target.exists()
+
+    def test_falls_back_to_shutil(self, tmp_path, monkeypatch):
+        target = tmp_path / "company"
+        _make_tree(target)
+        removed = []
+
+        def _rmtree(path, *args, **kwargs):
+            removed.append(Path(path))
+            return real_rmtree(path, *args, **kwargs)
+
+        real_rmtree = shutil.rmtree
+        monkeypatch.setattr(cli, "_walk_for_delete", lambda path: None)
+        monkeypatch.setattr(shutil, "rmtree", _rmtree)
+        cli._fast_rmtree(target)
+        assert removed == [target]
+        assert not target.exists()
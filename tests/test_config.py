@@ -10,10 +10,14 @@ import pytest
 from agent_company_ai.config import (
     CompanyConfig,
     AutonomousConfig,
+    ProfitEngineConfig,
     slugify,
     load_config,
+    load_all_company_configs,
+    load_config_preview,
     save_config,
     list_available_roles,
+    load_role,
     _expand_env_vars,
 )
 
@@ -54,6 +58,30 @@ class TestDefaults:
         assert cfg.profit_engine.enabled is False
 
 
+class TestProfitEngine:
+    """Test the business DNA string."""
+
+    def test_format_dna_follows_field_changes(self):
+        pe = ProfitEngineConfig(enabled=True, mission="Sell widgets")
+        assert "Sell widgets" in pe.format_dna()
+        pe.mission = "Sell gadgets"
+        assert "Sell gadgets" in pe.format_dna()
+        pe.enabled = False
+        assert pe.format_dna() == ""
+
+    def test_format_dna_of_copies(self):
+        pe = ProfitEngineConfig(enabled=True, mission="Sell widgets")
+        assert "Sell widgets" in pe.format_dna()
+        copy = pe.model_copy(update={"mission": "Sell gadgets"})
+        assert "Sell gadgets" in copy.format_dna()
+        assert "Sell widgets" in pe.format_dna()
+        assert pe.model_copy(update={"enabled": False}).format_dna() == ""
+
+    def test_format_dna_of_constructed_model(self):
+        pe = ProfitEngineConfig.model_construct(enabled=True, mission="Sell widgets")
+        assert "Sell widgets" in pe.format_dna()
+
+
 class TestSlugify:
     """Test the slugify helper."""
 
@@ -90,6 +118,22 @@ class TestEnvExpansion:
     def test_no_placeholders(self):
         assert _expand_env_vars("plain text") == "plain text"
 
+    def test_load_config_expands_nested_values(self):
+        os.environ["_TEST_EXPAND_KEY"] = "sk-nested"
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                path = Path(tmp) / "config.yaml"
+                path.write_text(
+                    "llm:\n  anthropic:\n    api_key: ${_TEST_EXPAND_KEY}\n"
+                    "    model: m\nagents:\n- name: ${_TEST_EXPAND_KEY}\n  role: ceo\n",
+                    encoding="utf-8",
+                )
+                cfg = load_config(path)
+                assert cfg.llm.anthropic.api_key == "sk-nested"
+                assert cfg.agents[0].name == "sk-nested"
+        finally:
+            del os.environ["_TEST_EXPAND_KEY"]
+
 
 class TestSaveLoad:
     """Test config round-trip."""
@@ -104,6 +148,70 @@ class TestSaveLoad:
             assert loaded.autonomous.max_cost_usd == 10.0
             assert loaded.autonomous.daily_budget_usd == 20.0
 
+    def test_load_returns_independent_copies(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.yaml"
+            save_config(CompanyConfig(name="Test Co"), path)
+            first = load_config(path)
+            first.name = "Mutated"
+            assert load_config(path).name == "Test Co"
+
+    def test_load_sees_rewritten_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.yaml"
+            save_config(CompanyConfig(name="Before"), path)
+            assert load_config(path).name == "Before"
+            save_config(CompanyConfig(name="After Rename"), path)
+            assert load_config(path).name == "After Rename"
+
+    def test_load_sees_hand_edit(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.yaml"
+            save_config(CompanyConfig(name="Saved"), path)
+            assert load_config(path).name == "Saved"
+            path.write_text("name: Edited By Hand\n", encoding="utf-8")
+            assert load_config(path).name == "Edited By Hand"
+            assert sorted(p.name for p in Path(tmp).iterdir()) == ["config.yaml"]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_save_keeps_config_permissions(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.yaml"
+            save_config(CompanyConfig(name="Secret Co"), path)
+            for mode in (0o600, 0o640):
+                path.chmod(mode)
+                save_config(CompanyConfig(name="Secret Co"), path)
+                assert path.stat().st_mode & 0o777 == mode
+
+    def test_load_all_company_configs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / ".agent-company-ai"
+            save_config(CompanyConfig(name="Beta"), root / "beta" / "config.yaml")
+            save_config(CompanyConfig(name="Alpha"), root / "alpha" / "config.yaml")
+            (root / "broken").mkdir()
+            (root / "broken" / "config.yaml").write_text("agents: 3\n", encoding="utf-8")
+            (root / "no-config").mkdir()
+            configs = load_all_company_configs(Path(tmp))
+            assert list(configs) == ["alpha", "beta", "broken"]
+            assert configs["alpha"].name == "Alpha"
+            assert configs["broken"] is None
+
+    def test_preview_name_and_agent_count(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.yaml"
+            path.write_text(
+                "agents:\n- name: a\n  role: ceo\n- name: b\n  role: cto\n"
+                "llm: {default_provider: openai}\nname: Preview Co\n",
+                encoding="utf-8",
+            )
+            assert load_config_preview(path) == ("Preview Co", 2)
+
+    def test_preview_defaults_for_empty_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.yaml"
+            path.write_text("", encoding="utf-8")
+            assert load_config_preview(path) == ("My AI Company", 0)
+
 
 class TestRoles:
     """Test role loading."""
@@ -113,3 +221,8 @@ class TestRoles:
         assert len(roles) >= 9
         assert "ceo" in roles
         assert "developer" in roles
+
+    def test_load_role_returns_independent_copies(self):
+        first = load_role("ceo")
+        first["title"] = "Mutated"
+        assert load_role("ceo")["title"] != "Mutated"
@@ -0,0 +1,85 @@
+"""Tests for the LLM provider layer."""
+
+from __future__ import annotations
+
+import asyncio
+import http.server
+import json
+import threading
+
+import pytest
+
+from agent_company_ai.llm.base import LLMMessage, shared_client
+
+_MESSAGE = {
+    "id": "msg_test",
+    "type": "message",
+    "role": "assistant",
+    "model": "test-model",
+    "content": [{"type": "text", "text": "pong"}],
+    "stop_reason": "end_turn",
+    "stop_sequence": None,
+    "usage": {"input_tokens": 1, "output_tokens": 1},
+}
+
+
+@pytest.fixture
+def message_server():
+    """Serve a canned Messages API reply over keep-alive HTTP/1.1."""
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            body = json.dumps(_MESSAGE).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestSharedClient:
+    """Test that SDK clients are shared per event loop only."""
+
+    def test_shared_within_one_loop(self):
+        async def fetch():
+            return shared_client("_test_key", object), shared_client("_test_key", object)
+
+        first, second = asyncio.run(fetch())
+        assert first is second
+
+    def test_not_reused_by_a_later_loop(self):
+        async def fetch():
+            return shared_client("_test_key", object)
+
+        assert asyncio.run(fetch()) is not asyncio.run(fetch())
+
+    def test_provider_usable_across_asyncio_runs(self, message_server):
+        pytest.importorskip("anthropic")
+        from agent_company_ai.llm.anthropic import AnthropicProvider
+
+        provider = AnthropicProvider(
+            api_key="sk-test", model="test-model", base_url=message_server,
+        )
+        # Fail on the first connection error instead of retrying past it.
+        build = provider._build_client
+        provider._build_client = lambda: build().with_options(max_retries=0)
+        messages = [LLMMessage(role="user", content="hi")]
+        # The second run would reuse a pooled keep-alive connection owned by
+        # the first, closed loop if clients were cached process-wide.
+        assert asyncio.run(provider.complete(messages)).content == "pong"
+        assert asyncio.run(provider.complete(messages)).content == "pong"
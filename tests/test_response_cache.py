@@ -0,0 +1,81 @@
+"""Tests for the exact-match LLM response cache."""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+from agent_company_ai.core import response_cache
+from agent_company_ai.core.response_cache import ResponseCache
+from agent_company_ai.llm.base import BaseLLMProvider, LLMMessage, LLMResponse, ToolCall
+from agent_company_ai.storage.database import Database
+
+
+class _Provider(BaseLLMProvider):
+    async def complete(self, messages, tools=None):
+        raise NotImplementedError
+
+    async def stream(self, messages, tools=None):
+        yield ""
+
+
+_MESSAGES = [LLMMessage(role="system", content="s"), LLMMessage(role="user", content="hi")]
+
+
+def _with_cache(check, ttl_seconds: int = 60):
+    """Run ``check(cache)`` against a cache in a fresh database."""
+
+    async def run():
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Database(Path(tmp) / "company.db")
+            await db.connect()
+            try:
+                await check(ResponseCache(db, ttl_seconds))
+            finally:
+                await db.close()
+
+    asyncio.run(run())
+
+
+class TestResponseCache:
+    """Test storing and replaying replies."""
+
+    def test_hit_and_miss(self):
+        async def check(cache):
+            key = cache.key(_Provider("k", "m"), _MESSAGES, None)
+            assert await cache.get(key) is None
+            await cache.put(key, LLMResponse(content="hello", stop_reason="end_turn"))
+            hit = await cache.get(key)
+            assert (hit.content, hit.stop_reason, hit.usage) == ("hello", "end_turn", None)
+
+        _with_cache(check)
+
+    def test_key_covers_endpoint_and_max_tokens(self):
+        base = ResponseCache.key(_Provider("k", "m"), _MESSAGES, None)
+        assert base != ResponseCache.key(_Provider("k", "m", base_url="http://other"), _MESSAGES, None)
+        assert base != ResponseCache.key(_Provider("k", "m", max_tokens=100), _MESSAGES, None)
+        assert base != ResponseCache.key(_Provider("k", "m2"), _MESSAGES, None)
+
+    def test_entries_expire(self, monkeypatch):
+        async def check(cache):
+            key = cache.key(_Provider("k", "m"), _MESSAGES, None)
+            await cache.put(key, LLMResponse(content="hello"))
+            now = response_cache.time.time()
+            monkeypatch.setattr(response_cache.time, "time", lambda: now + 61)
+            assert await cache.get(key) is None
+
+        _with_cache(check, ttl_seconds=60)
+
+    def test_tool_calls_and_truncated_replies_not_stored(self):
+        async def check(cache):
+            key = cache.key(_Provider("k", "m"), _MESSAGES, None)
+            await cache.put(key, LLMResponse(
+                content="", tool_calls=[ToolCall(id="1", name="web_search", arguments={})],
+            ))
+            assert await cache.get(key) is None
+            for stop_reason in ("max_tokens", "length"):
+                await cache.put(key, LLMResponse(content="cut", stop_reason=stop_reason))
+                assert await cache.get(key) is None
+
+        _with_cache(check)
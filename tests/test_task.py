@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+
+import pytest
+
 from agent_company_ai.core.task import Task, TaskBoard, TaskStatus
 
 
@@ -74,6 +78,29 @@ class TestTerminal:
         assert task.is_terminal
 
 
+class TestWaitDone:
+    """Test awaiting a task's terminal transition."""
+
+    def test_wakes_on_complete(self):
+        async def run():
+            task = Task.create(description="Test", assignee="alice")
+            asyncio.get_running_loop().call_soon(task.complete, "ok")
+            await task.wait_done(timeout=1)
+            return task
+
+        assert asyncio.run(run()).status == TaskStatus.DONE
+
+    def test_already_terminal_returns(self):
+        task = Task.create(description="Test")
+        task.fail("err")
+        asyncio.run(task.wait_done(timeout=0))
+
+    def test_timeout(self):
+        task = Task.create(description="Test")
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(task.wait_done(timeout=0.01))
+
+
 class TestSubtasks:
     """Test subtask management."""
 
@@ -96,6 +123,14 @@ class TestSubtasks:
         sub2.complete("ok")
         assert task.all_subtasks_done is True
 
+    def test_subtask_counts(self):
+        task = Task.create(description="Parent")
+        sub1 = task.add_subtask("Sub 1")
+        task.add_subtask("Sub 2")
+        sub1.complete("ok")
+        assert task.subtask_count == 2
+        assert task.subtasks_done == 1
+
 
 class TestToDict:
     """Test serialization."""
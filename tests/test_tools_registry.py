@@ -157,3 +157,11 @@ class TestToolDecorator:
         t = registry.get_tool("_test_decorator_tool")
         assert t is not None
         assert t.description == "A test decorator tool"
+        assert t.reentrant is False
+
+    def test_decorator_reentrant(self):
+        @tool("_test_pure_read_tool", "A side-effect-free lookup", reentrant=True)
+        def _test_fn() -> str:
+            return "ok"
+
+        assert ToolRegistry.get().get_tool("_test_pure_read_tool").reentrant is True